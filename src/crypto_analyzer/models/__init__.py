@@ -1,7 +1,7 @@
 """Data models for the crypto analyzer"""
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 import pandas as pd
 
 
@@ -55,10 +55,75 @@ class TradingSignal:
         else:
             raise ValueError(f"Unsupported CSV format. Expected columns: timestamp_utc, coin, entry OR Timestamp, Coin_Name, CMP")
     
+    @classmethod
+    def batch_from_dataframe(cls, df: pd.DataFrame) -> List['TradingSignal']:
+        """Create TradingSignals for every valid row of a CSV DataFrame
+        
+        Column-wise equivalent of calling from_csv_row per row; rows that
+        from_csv_row would reject (e.g. no usable entry price) are skipped.
+        """
+        signals = cls.frame_from_dataframe(df)
+        return [
+            cls(timestamp=timestamp, coin_name=coin_name, entry_price=entry_price, date=date, time=time)
+            for timestamp, coin_name, entry_price, date, time in zip(
+                signals['timestamp'], signals['coin_name'].tolist(), signals['entry_price'].tolist(),
+                signals['date'].tolist(), signals['time'].tolist()
+            )
+        ]
+    
+    @classmethod
+    def frame_from_dataframe(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Parse every valid row of a CSV DataFrame into signal columns
+        
+        Returns timestamp, coin_name, entry_price, date and time columns with
+        the values batch_from_dataframe would use, without creating objects.
+        """
+        # Handle your specific CSV format
+        if 'timestamp_utc' in df.columns and 'coin' in df.columns and 'entry' in df.columns:
+            timestamps = pd.to_datetime(df['timestamp_utc'], utc=True, errors='coerce', format='mixed')
+            coin_names = df['coin'].astype(str).str.strip().str.upper()
+            
+            # Empty entries fall back to the stop loss, like from_csv_row
+            raw_entry = df['entry']
+            entry_prices = pd.to_numeric(raw_entry, errors='coerce')
+            if 'sl' in df.columns:
+                blank = raw_entry.isna() | (raw_entry == '')
+                entry_prices = entry_prices.mask(blank, pd.to_numeric(df['sl'], errors='coerce'))
+            
+            dates = timestamps.dt.strftime('%Y-%m-%d')
+            times = timestamps.dt.strftime('%H:%M:%S')
+        
+        # Handle standard CSV format
+        elif 'Timestamp' in df.columns and 'Coin_Name' in df.columns and 'CMP' in df.columns:
+            timestamps = pd.to_datetime(df['Timestamp'], utc=True, errors='coerce', format='mixed')
+            coin_names = df['Coin_Name'].str.strip().str.upper()
+            entry_prices = pd.to_numeric(df['CMP'], errors='coerce')
+            dates = df['Date'] if 'Date' in df.columns else timestamps.dt.strftime('%Y-%m-%d')
+            times = df['Time'] if 'Time' in df.columns else timestamps.dt.strftime('%H:%M:%S')
+        
+        else:
+            raise ValueError(f"Unsupported CSV format. Expected columns: timestamp_utc, coin, entry OR Timestamp, Coin_Name, CMP")
+        
+        entry_prices = entry_prices.astype(float)
+        valid = timestamps.notna() & coin_names.notna() & entry_prices.notna()
+        signals = pd.DataFrame({
+            'timestamp': timestamps,
+            'coin_name': coin_names,
+            'entry_price': entry_prices,
+            'date': dates,
+            'time': times
+        })
+        return signals[valid.to_numpy()]
+    
     @property
     def symbol(self) -> str:
         """Get Binance symbol for this coin"""
-        coin = self.coin_name.strip().upper()
+        return self.symbol_for(self.coin_name)
+    
+    @staticmethod
+    def symbol_for(coin_name: str) -> str:
+        """Get Binance symbol for a coin name"""
+        coin = coin_name.strip().upper()
         
         # Comprehensive symbol mappings for problematic coins
         symbol_mappings = {
@@ -186,14 +186,10 @@ class PortfolioCalculator:
                 df['Timestamp'] = pd.to_datetime(df['Timestamp'], utc=True)
                 df = df.sort_values('Timestamp')
             
-            signals = []
-            for _, row in df.iterrows():
-                try:
-                    signal = TradingSignal.from_csv_row(row)
-                    signals.append(signal)
-                except Exception as e:
-                    logger.warning(f"Error processing row: {e}")
-                    continue
+            signals = TradingSignal.batch_from_dataframe(df)
+            skipped = len(df) - len(signals)
+            if skipped:
+                logger.warning(f"Skipped {skipped} rows without a valid coin or entry price")
             
             logger.info(f"Successfully loaded {len(signals)} valid signals from {len(df)} rows")
             return signals
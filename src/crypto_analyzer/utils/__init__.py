@@ -1,6 +1,7 @@
 """Utility functions for the crypto analyzer"""
 from datetime import datetime, timezone, timedelta
 from typing import Optional
+import numpy as np
 import pandas as pd
 import os
 import glob
@@ -34,10 +35,37 @@ def floor_to_timeframe(dt: datetime, minutes: int) -> datetime:
         return dt
 
 
+# Timeframes floor_to_timeframe aligns to; anything else floors to the minute
+_TIMEFRAME_MINUTES = frozenset((1, 5, 15, 60, 240, 1440))
+_NS_PER_MINUTE = 60 * 10**9
+
+
+def floor_to_timeframe_array(timestamps: np.ndarray, minutes: int) -> np.ndarray:
+    """Floor an array of UTC timestamps to timeframe boundaries
+    
+    Vectorised counterpart of floor_to_timeframe for whole columns; returns
+    naive datetime64[ns] values in UTC.
+    """
+    values = np.asarray(timestamps, dtype='datetime64[ns]')
+    step = minutes * _NS_PER_MINUTE if minutes in _TIMEFRAME_MINUTES else _NS_PER_MINUTE
+    return ((values.view('i8') // step) * step).view('datetime64[ns]')
+
+
+def validate_csv_file_fast(df: pd.DataFrame, required_columns: list) -> bool:
+    """Check CSV file has required columns, stopping at the first missing one"""
+    columns = frozenset(df.columns)
+    for col in required_columns:
+        if col not in columns:
+            return False
+    return True
+
+
 def validate_csv_file(df: pd.DataFrame, required_columns: list) -> tuple[bool, list]:
     """Validate CSV file has required columns"""
+    if validate_csv_file_fast(df, required_columns):
+        return True, []
     missing_cols = [col for col in required_columns if col not in df.columns]
-    return len(missing_cols) == 0, missing_cols
+    return False, missing_cols
 
 
 def load_and_validate_csv(file_path: str) -> Optional[pd.DataFrame]:
@@ -58,8 +86,8 @@ def load_and_validate_csv(file_path: str) -> Optional[pd.DataFrame]:
             logger.error("Expected either: timestamp_utc, coin, entry OR Timestamp, Coin_Name, CMP")
             return None
         
-        is_valid, missing_cols = validate_csv_file(df, required_cols)
-        if not is_valid:
+        if not validate_csv_file_fast(df, required_cols):
+            _, missing_cols = validate_csv_file(df, required_cols)
             logger.error(f"Missing required columns in {file_path}: {missing_cols}")
             return None
         
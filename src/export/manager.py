@@ -226,13 +226,11 @@ class ExportManager:
         from src.reports.generator import ReportGenerator
         report_generator = ReportGenerator(self.config, self.logger)
         
-        report_content = report_generator.generate_comprehensive_report(
-            analysis_results, 'comprehensive'
-        )
-        
-        # Write to file
+        # Stream sections straight to file
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+            report_generator.generate_comprehensive_report_into(
+                analysis_results, f, 'comprehensive'
+            )
         
         return str(file_path)
     
@@ -5,439 +5,512 @@ Enterprise Report Generator
 Professional report generation with multiple formats and templates.
 """
 
+import heapq
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from types import MappingProxyType
+from typing import IO, Any, Dict, Iterator, Optional
 import pandas as pd
 
+# Shared read-only default for missing nested result blocks
+_EMPTY = MappingProxyType({})
+
+_SEP25 = '=' * 25
+_SEP30 = '=' * 30
+_SEP35 = '=' * 35
+_SEP40 = '=' * 40
+_SEP70 = '=' * 70
+
+# Static section banners
+_OPTIMIZATION_HEADER = f"\n⚙️ PARAMETER OPTIMIZATION ANALYSIS\n{_SEP40}\n"
+_MARKET_CONDITIONS_HEADER = f"\n🔍 MARKET REGIME ANALYSIS\n{_SEP30}\n"
+_ASSET_PERFORMANCE_HEADER = f"\n🏆 ASSET PERFORMANCE ANALYSIS\n{_SEP35}\n"
+_ML_INSIGHTS_HEADER = f"\n🤖 MACHINE LEARNING INSIGHTS\n{_SEP35}\n"
+_VALIDATION_HEADER = f"\n✅ STATISTICAL VALIDATION\n{_SEP30}\n"
+
+# Static tail of the recommendations section
+_DISCLAIMER_BLOCK = """⚠️ RISK DISCLAIMERS:
+• Past performance does not guarantee future results
+• Market conditions can change rapidly
+• Recommendations based on historical data analysis
+• Consider current market context before implementation
+
+📋 MONITORING RECOMMENDATIONS:
+• Update analysis monthly with new signal data
+• Monitor for regime changes in market conditions
+• Validate performance against live trading results
+• Adjust parameters based on ongoing performance data
+"""
+
+# Static support/compliance lines of the footer
+_FOOTER_NOTICE = """📧 SUPPORT: For questions about this analysis or methodology
+🔄 UPDATES: Recommend monthly analysis updates for optimal results
+⚖️ COMPLIANCE: This analysis is for informational purposes only
+
+© 2025 Enterprise Trading Analytics Platform. All rights reserved."""
+
+# Report scaffolds rendered with str.format_map
+_HEADER_TEMPLATE = """
+🏢 ENTERPRISE TRADING SIGNAL ANALYSIS REPORT
+""" + _SEP70 + """
+📅 Generated: {timestamp}
+🌍 Trading Timezone: {timezone}
+📊 Analysis Period: {start} to {end}
+📈 Dataset: {signal_count:,} signals from {unique_assets} assets
+⚙️ Analysis Version: {version}
+👤 Generated for: {user}
+
+"""
+
+_EXECUTIVE_SUMMARY_TEMPLATE = """
+📋 EXECUTIVE SUMMARY
+""" + _SEP25 + """
+• Portfolio Size: {signal_count:,} trading signals analyzed
+• Asset Diversity: {unique_assets} unique cryptocurrencies
+• Analysis Completion: {analysis_duration:.2f} seconds processing time
+• Confidence Level: {confidence_pct:.0f}% statistical confidence
+• Data Quality: {completeness_pct:.1f}% data completeness
+
+🎯 KEY FINDINGS:
+• Optimal Risk Range: {risk_range}
+• Best Trading Hour: {hour}:00 {timezone} time
+• Top Market Session: {session}
+• Statistical Significance: {significance}
+
+"""
+
+_RECOMMENDATIONS_TEMPLATE = """
+🎯 ENTERPRISE RECOMMENDATIONS
+""" + _SEP35 + """
+
+🔥 IMMEDIATE ACTIONS:
+1. 📈 OPTIMAL TIMING: Focus trading during {hour}:00 {timezone} time
+2. ⚖️ RISK MANAGEMENT: Use {risk_range} risk levels
+3. 🕐 SESSION FOCUS: Prioritize {session} market session
+4. 📊 MONITORING: Track performance metrics continuously
+
+💡 STRATEGIC INSIGHTS:
+• Risk-Reward Optimization: Data indicates optimal balance at specified parameters
+• Market Timing: Statistical analysis confirms time-based performance patterns
+• Asset Selection: Focus on top-performing categories and individual assets
+• Validation: All recommendations backed by {confidence_pct:.0f}% confidence level
+
+""" + _DISCLAIMER_BLOCK + "\n"
+
+_FOOTER_TEMPLATE = """
+""" + _SEP70 + """
+🏷️ REPORT METADATA
+• Generated by: Enterprise Trading Signal Analyzer v{version}
+• Analysis Engine: Statistical + Machine Learning Hybrid
+• Report Type: Comprehensive Professional Analysis
+• Generated: {timestamp}
+• Environment: {environment}
+
+""" + _FOOTER_NOTICE + "\n" + _SEP70 + "\n"
+
+@lru_cache(maxsize=64)
+def _pretty_label(name: str) -> str:
+    """Turn a snake_case result key into a display label"""
+    return name.replace('_', ' ').title()
+
+def _signal_counts(stats: Any) -> Optional[pd.Series]:
+    """Return the per-group signal count column of an aggregated stats frame"""
+    
+    if not isinstance(stats, pd.DataFrame) or stats.empty:
+        return None
+    
+    # ('coin', 'count') when other columns use multiple aggregations, 'coin' otherwise
+    for column in (('coin', 'count'), 'coin'):
+        if column in stats.columns:
+            return stats[column]
+    return None
+
+def _stat_column(block: Dict[Any, Any], column: str, stat: str) -> Optional[Dict[Any, Any]]:
+    """Look up one aggregated column in a DataFrame.to_dict() block"""
+    
+    # MultiIndex columns serialise to ('column', 'stat') keys; nested dicts are also accepted
+    values = block.get((column, stat))
+    if values is None:
+        values = (block.get(column) or _EMPTY).get(stat)
+    return values
+
 class ReportGenerator:
     """Enterprise-grade report generator with professional formatting"""
     
+    __slots__ = ('config', 'logger', 'report_config', '_app_version', '_app_env')
+    
+    # (analysis result key, section method, takes timezone) in report order
+    _SECTIONS = (
+        ('time_patterns', '_generate_time_patterns_section', True),
+        ('parameter_optimization', '_generate_optimization_section', False),
+        ('market_conditions', '_generate_market_conditions_section', False),
+        ('asset_performance', '_generate_asset_performance_section', False),
+        ('ml_predictions', '_generate_ml_insights_section', False),
+        ('statistical_validation', '_generate_validation_section', False),
+    )
+    
     def __init__(self, config, logger):
         self.config = config
         self.logger = logger
         self.report_config = config.get('reporting', {})
+        self._app_version = config.get('app.version', '2.0.0')
+        self._app_env = config.get('app.environment', 'Production')
         
     def generate_comprehensive_report(self, analysis_results: Dict[str, Any], format_type: str = 'comprehensive') -> str:
         """Generate comprehensive enterprise report"""
         
-        metadata = analysis_results.get('metadata', {})
-        timezone = metadata.get('timezone', 'Unknown')
-        
-        # Report header
-        report = self._generate_header(metadata, timezone)
-        
-        # Executive summary
-        report += self._generate_executive_summary(analysis_results)
+        return ''.join(self._iter_report_sections(analysis_results))
+    
+    def generate_comprehensive_report_into(self, analysis_results: Dict[str, Any], out: IO[str],
+                                           format_type: str = 'comprehensive') -> None:
+        """Write comprehensive enterprise report section by section to a text stream"""
         
-        # Time patterns section
-        if 'time_patterns' in analysis_results:
-            report += self._generate_time_patterns_section(analysis_results['time_patterns'], timezone)
+        out.writelines(self._iter_report_sections(analysis_results))
+    
+    def _iter_report_sections(self, analysis_results: Dict[str, Any]) -> Iterator[str]:
+        """Yield report sections in output order"""
         
-        # Parameter optimization section
-        if 'parameter_optimization' in analysis_results:
-            report += self._generate_optimization_section(analysis_results['parameter_optimization'])
+        metadata = analysis_results.get('metadata') or _EMPTY
+        timezone = metadata.get('timezone', 'Unknown')
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        # Market conditions section
-        if 'market_conditions' in analysis_results:
-            report += self._generate_market_conditions_section(analysis_results['market_conditions'])
+        # Optimization results feed both the summary and the recommendations
+        opt_results = analysis_results.get('parameter_optimization') or _EMPTY
+        recommendations = opt_results.get('recommendations') or _EMPTY
+        confidence_pct = float(opt_results.get('confidence_level', 0.95)) * 100.0
         
-        # Asset performance section
-        if 'asset_performance' in analysis_results:
-            report += self._generate_asset_performance_section(analysis_results['asset_performance'])
+        # Report header
+        yield self._generate_header(metadata, timezone, timestamp)
         
-        # ML insights section
-        if 'ml_predictions' in analysis_results and analysis_results['ml_predictions'].get('model_available'):
-            report += self._generate_ml_insights_section(analysis_results['ml_predictions'])
+        # Executive summary
+        yield self._generate_executive_summary(metadata, opt_results, recommendations, confidence_pct)
         
-        # Statistical validation section
-        if 'statistical_validation' in analysis_results:
-            report += self._generate_validation_section(analysis_results['statistical_validation'])
+        # Analysis sections, each only when its results are present
+        for key, method_name, takes_timezone in self._SECTIONS:
+            if key in analysis_results:
+                section = getattr(self, method_name)
+                if takes_timezone:
+                    yield section(analysis_results[key], timezone)
+                else:
+                    yield section(analysis_results[key])
         
         # Recommendations section
-        report += self._generate_recommendations_section(analysis_results)
+        yield self._generate_recommendations_section(metadata, recommendations, confidence_pct)
         
         # Footer
-        report += self._generate_footer()
-        
-        return report
+        yield self._generate_footer(timestamp)
     
-    def _generate_header(self, metadata: Dict[str, Any], timezone: str) -> str:
+    def _generate_header(self, metadata: Dict[str, Any], timezone: str, timestamp: str) -> str:
         """Generate professional report header"""
         
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        return f"""
-🏢 ENTERPRISE TRADING SIGNAL ANALYSIS REPORT
-{'='*70}
-📅 Generated: {timestamp}
-🌍 Trading Timezone: {timezone}
-📊 Analysis Period: {metadata.get('date_range', {}).get('start', 'N/A')} to {metadata.get('date_range', {}).get('end', 'N/A')}
-📈 Dataset: {metadata.get('signal_count', 0):,} signals from {metadata.get('unique_assets', 0)} assets
-⚙️ Analysis Version: {self.config.get('app.version', '2.0.0')}
-👤 Generated for: {metadata.get('user', 'Enterprise User')}
-
-"""
+        date_range = metadata.get('date_range') or _EMPTY
+        
+        return _HEADER_TEMPLATE.format_map({
+            'timestamp': timestamp,
+            'timezone': timezone,
+            'start': date_range.get('start', 'N/A'),
+            'end': date_range.get('end', 'N/A'),
+            'signal_count': metadata.get('signal_count', 0),
+            'unique_assets': metadata.get('unique_assets', 0),
+            'version': self._app_version,
+            'user': metadata.get('user', 'Enterprise User'),
+        })
     
-    def _generate_executive_summary(self, analysis_results: Dict[str, Any]) -> str:
+    def _generate_executive_summary(self, metadata: Dict[str, Any], opt_results: Dict[str, Any],
+                                    recommendations: Dict[str, Any], confidence_pct: float) -> str:
         """Generate executive summary section"""
         
-        metadata = analysis_results.get('metadata', {})
-        
         # Calculate key metrics
         signal_count = metadata.get('signal_count', 0)
         unique_assets = metadata.get('unique_assets', 0)
         analysis_duration = metadata.get('analysis_duration', 0)
         
-        # Get optimization results for summary
-        opt_results = analysis_results.get('parameter_optimization', {})
-        recommendations = opt_results.get('recommendations', {})
-        
-        return f"""
-📋 EXECUTIVE SUMMARY
-{'='*25}
-• Portfolio Size: {signal_count:,} trading signals analyzed
-• Asset Diversity: {unique_assets} unique cryptocurrencies
-• Analysis Completion: {analysis_duration:.2f} seconds processing time
-• Confidence Level: {opt_results.get('confidence_level', 0.95)*100:.0f}% statistical confidence
-• Data Quality: {metadata.get('completeness_pct', 0):.1f}% data completeness
-
-🎯 KEY FINDINGS:
-• Optimal Risk Range: {recommendations.get('optimal_risk_range', 'Calculating...')}
-• Best Trading Hour: {recommendations.get('optimal_hour', 'TBD')}:00 {metadata.get('timezone', '')} time
-• Top Market Session: {recommendations.get('optimal_session', 'Analyzing...')}
-• Statistical Significance: {'Validated' if opt_results.get('significance_tests') else 'Pending'}
-
-"""
+        return _EXECUTIVE_SUMMARY_TEMPLATE.format_map({
+            'signal_count': signal_count,
+            'unique_assets': unique_assets,
+            'analysis_duration': analysis_duration,
+            'confidence_pct': confidence_pct,
+            'completeness_pct': metadata.get('completeness_pct', 0),
+            'risk_range': recommendations.get('optimal_risk_range', 'Calculating...'),
+            'hour': recommendations.get('optimal_hour', 'TBD'),
+            'timezone': metadata.get('timezone', ''),
+            'session': recommendations.get('optimal_session', 'Analyzing...'),
+            'significance': 'Validated' if opt_results.get('significance_tests') else 'Pending',
+        })
     
     def _generate_time_patterns_section(self, time_patterns: Dict[str, Any], timezone: str) -> str:
         """Generate time patterns analysis section"""
         
-        report = f"""
+        parts = [f"""
 ⏰ TIME PATTERN ANALYSIS ({timezone})
-{'='*40}
-"""
+{_SEP40}
+"""]
         
         # Hourly patterns
-        if 'hourly' in time_patterns:
-            hourly_data = time_patterns['hourly']
-            if hasattr(hourly_data, 'to_dict'):
-                hourly_dict = hourly_data.to_dict()
-                
-                # Find best hours by signal count and performance
-                if 'coin' in hourly_dict and 'count' in hourly_dict['coin']:
-                    signal_counts = hourly_dict['coin']['count']
-                    best_activity_hour = max(signal_counts.items(), key=lambda x: x[1])
-                    
-                    report += f"""
+        signal_counts = _signal_counts(time_patterns.get('hourly'))
+        if signal_counts is not None:
+            # Find best hour by signal count
+            best_hour = signal_counts.idxmax()
+            
+            parts.append(f"""
 📊 HOURLY PATTERNS:
-• Peak Activity: Hour {best_activity_hour[0]} with {best_activity_hour[1]} signals
-• Activity Distribution: Signals spread across {len(signal_counts)} different hours
-"""
+• Peak Activity: Hour {best_hour} with {int(signal_counts[best_hour])} signals
+• Activity Distribution: Signals spread across {signal_counts.size} different hours
+""")
         
         # Session patterns
-        if 'session' in time_patterns:
-            session_data = time_patterns['session']
-            if hasattr(session_data, 'to_dict'):
-                session_dict = session_data.to_dict()
-                
-                if 'coin' in session_dict and 'count' in session_dict['coin']:
-                    session_counts = session_dict['coin']['count']
-                    best_session = max(session_counts.items(), key=lambda x: x[1])
-                    
-                    report += f"""
+        session_counts = _signal_counts(time_patterns.get('session'))
+        if session_counts is not None:
+            best_session = session_counts.idxmax()
+            
+            parts.append(f"""
 🕐 SESSION ANALYSIS:
-• Most Active Session: {best_session[0]} ({best_session[1]} signals)
-• Session Coverage: {len(session_counts)} market sessions analyzed
-"""
+• Most Active Session: {best_session} ({int(session_counts[best_session])} signals)
+• Session Coverage: {session_counts.size} market sessions analyzed
+""")
         
         # Weekend analysis
-        if 'weekend' in time_patterns:
-            weekend_data = time_patterns['weekend']
-            if hasattr(weekend_data, 'to_dict'):
-                weekend_dict = weekend_data.to_dict()
-                
-                if 'coin' in weekend_dict and 'count' in weekend_dict['coin']:
-                    weekend_counts = weekend_dict['coin']['count']
-                    weekend_signals = weekend_counts.get(True, 0)
-                    weekday_signals = weekend_counts.get(False, 0)
-                    total_signals = weekend_signals + weekday_signals
-                    
-                    if total_signals > 0:
-                        weekend_pct = (weekend_signals / total_signals) * 100
-                        report += f"""
+        weekend_counts = _signal_counts(time_patterns.get('weekend'))
+        if weekend_counts is not None:
+            weekend_signals = int(weekend_counts.get(True, 0))
+            weekday_signals = int(weekend_counts.get(False, 0))
+            total_signals = weekend_signals + weekday_signals
+            
+            if total_signals > 0:
+                weekend_pct = (weekend_signals / total_signals) * 100
+                parts.append(f"""
 📅 WEEKEND vs WEEKDAY:
 • Weekend Activity: {weekend_signals} signals ({weekend_pct:.1f}%)
 • Weekday Activity: {weekday_signals} signals ({100-weekend_pct:.1f}%)
-"""
+""")
         
-        return report
+        return ''.join(parts)
     
     def _generate_optimization_section(self, optimization_results: Dict[str, Any]) -> str:
         """Generate parameter optimization section"""
         
-        report = f"""
-⚙️ PARAMETER OPTIMIZATION ANALYSIS
-{'='*40}
-"""
+        parts = [_OPTIMIZATION_HEADER]
         
         # Risk analysis
-        risk_analysis = optimization_results.get('risk_analysis', {})
+        risk_analysis = optimization_results.get('risk_analysis') or _EMPTY
         if risk_analysis:
             # Find best performing risk ranges
-            best_ranges = sorted(
+            best_ranges = heapq.nlargest(
+                3,
                 risk_analysis.items(),
-                key=lambda x: x[1].get('success_potential', 0),
-                reverse=True
-            )[:3]
+                key=lambda x: x[1].get('success_potential', 0)
+            )
             
-            report += f"""
+            parts.append(f"""
 💰 RISK LEVEL OPTIMIZATION:
-"""
+""")
             for i, (range_name, stats) in enumerate(best_ranges, 1):
-                report += f"""  {i}. {range_name}: {stats.get('success_potential', 0):.1f}% success rate ({stats.get('count', 0)} signals)
+                parts.append(f"""  {i}. {range_name}: {stats.get('success_potential', 0):.1f}% success rate ({stats.get('count', 0)} signals)
      • Average R/R: {stats.get('avg_rr_ratio', 0):.2f}
      • Strong Signals: {stats.get('strong_signal_pct', 0):.1f}%
-"""
+""")
         
         # Time optimization
-        recommendations = optimization_results.get('recommendations', {})
+        recommendations = optimization_results.get('recommendations') or _EMPTY
         if recommendations:
-            report += f"""
+            parts.append(f"""
 ⏱️ OPTIMAL TRADING PARAMETERS:
 • Risk Range: {recommendations.get('optimal_risk_range', 'Calculating...')}
 • Trading Hour: {recommendations.get('optimal_hour', 'TBD')}:00 (Performance: {recommendations.get('hour_performance', 0):.2f} avg R/R)
 • Market Session: {recommendations.get('optimal_session', 'Analyzing...')} (Performance: {recommendations.get('session_performance', 0):.2f} avg R/R)
 • Reasoning: {recommendations.get('risk_reasoning', 'Data-driven optimization based on historical performance')}
-"""
+""")
         
         # Statistical significance
-        significance_tests = optimization_results.get('significance_tests', {})
+        significance_tests = optimization_results.get('significance_tests') or _EMPTY
         if significance_tests:
-            report += f"""
+            parts.append(f"""
 📊 STATISTICAL VALIDATION:
-"""
+""")
             for test_name, test_results in significance_tests.items():
-                if isinstance(test_results, dict) and 'significant' in test_results:
-                    status = "✅ Significant" if test_results['significant'] else "⚠️ Not Significant"
+                significant = test_results.get('significant') if isinstance(test_results, dict) else None
+                if significant is not None:
+                    status = "✅ Significant" if significant else "⚠️ Not Significant"
                     interpretation = test_results.get('interpretation', 'Statistical test performed')
-                    report += f"• {test_name.replace('_', ' ').title()}: {status} (p={test_results.get('p_value', 0):.3f})\n"
-                    report += f"  {interpretation}\n"
+                    parts.extend([
+                        f"• {_pretty_label(test_name)}: {status} (p={test_results.get('p_value', 0):.3f})\n",
+                        f"  {interpretation}\n",
+                    ])
         
-        return report
+        return ''.join(parts)
     
     def _generate_market_conditions_section(self, market_conditions: Dict[str, Any]) -> str:
         """Generate market conditions section"""
         
-        report = f"""
-🔍 MARKET REGIME ANALYSIS
-{'='*30}
-"""
+        parts = [_MARKET_CONDITIONS_HEADER]
         
         if market_conditions.get('regime_analysis'):
             clusters_found = market_conditions.get('clusters_found', 0)
-            report += f"""
+            parts.append(f"""
 • Market Regimes Detected: {clusters_found} distinct trading environments
 • Analysis Method: K-means clustering with {len(market_conditions.get('feature_columns', []))} features
 • Pattern Recognition: Advanced statistical clustering applied
-"""
+""")
             
             # Analyze weekly data if available
             weekly_data = market_conditions.get('weekly_data')
-            if weekly_data is not None and hasattr(weekly_data, '__len__'):
+            if isinstance(weekly_data, pd.DataFrame):
                 total_periods = len(weekly_data)
                 
                 if 'regime_label' in weekly_data.columns:
-                    regime_counts = weekly_data['regime_label'].value_counts()
-                    if len(regime_counts) > 0:
-                        best_regime = regime_counts.index[0]
-                        best_count = regime_counts.iloc[0]
-                        report += f"""
+                    regime_labels = weekly_data['regime_label']
+                    regime_counts = regime_labels.groupby(regime_labels, sort=False).size()
+                    if regime_counts.size:
+                        best_index = regime_counts.values.argmax()
+                        best_regime = regime_counts.index[best_index]
+                        best_count = int(regime_counts.iat[best_index])
+                        parts.append(f"""
 • Dominant Market Regime: {best_regime} ({best_count}/{total_periods} periods)
 • Regime Stability: {(best_count/total_periods)*100:.1f}% of analyzed periods
-"""
+""")
         else:
-            report += """
+            parts.append("""
 • Market Regime Analysis: Insufficient data for reliable clustering
 • Recommendation: Collect more historical data for regime detection
-"""
+""")
         
-        return report
+        return ''.join(parts)
     
     def _generate_asset_performance_section(self, asset_performance: Dict[str, Any]) -> str:
         """Generate asset performance section"""
         
-        report = f"""
-🏆 ASSET PERFORMANCE ANALYSIS
-{'='*35}
-"""
+        parts = [_ASSET_PERFORMANCE_HEADER]
         
         # Top performers
-        top_performers = asset_performance.get('top_performers', {})
-        if top_performers and 'risk_reward_ratio' in top_performers and 'mean' in top_performers['risk_reward_ratio']:
-            rr_means = top_performers['risk_reward_ratio']['mean']
+        top_performers = asset_performance.get('top_performers') or _EMPTY
+        rr_means = _stat_column(top_performers, 'risk_reward_ratio', 'mean')
+        if rr_means:
+            # Signal counts per asset, if available
+            top_counts = _stat_column(top_performers, 'timestamp_local', 'count') or _EMPTY
             
-            report += f"""
+            parts.append(f"""
 💎 TOP PERFORMING ASSETS:
-"""
+""")
             # Sort and show top 5
-            sorted_assets = sorted(rr_means.items(), key=lambda x: x[1], reverse=True)[:5]
+            sorted_assets = heapq.nlargest(5, rr_means.items(), key=itemgetter(1))
             for i, (asset, rr_ratio) in enumerate(sorted_assets, 1):
-                # Get signal count if available
-                signal_count = 'N/A'
-                if 'timestamp_local' in top_performers and 'count' in top_performers['timestamp_local']:
-                    signal_count = top_performers['timestamp_local']['count'].get(asset, 'N/A')
-                
-                report += f"  {i}. {asset}: {rr_ratio:.2f} avg R/R ({signal_count} signals)\n"
+                signal_count = top_counts.get(asset, 'N/A')
+                parts.append(f"  {i}. {asset}: {rr_ratio:.2f} avg R/R ({signal_count} signals)\n")
         
         # Most active assets
-        most_active = asset_performance.get('most_active', {})
-        if most_active and 'timestamp_local' in most_active and 'count' in most_active['timestamp_local']:
-            signal_counts = most_active['timestamp_local']['count']
-            
-            report += f"""
+        most_active = asset_performance.get('most_active') or _EMPTY
+        signal_counts = _stat_column(most_active, 'timestamp_local', 'count')
+        if signal_counts:
+            parts.append(f"""
 📈 MOST ACTIVE ASSETS:
-"""
-            sorted_active = sorted(signal_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+""")
+            sorted_active = heapq.nlargest(5, signal_counts.items(), key=itemgetter(1))
             for i, (asset, count) in enumerate(sorted_active, 1):
-                report += f"  {i}. {asset}: {count} signals\n"
+                parts.append(f"  {i}. {asset}: {count} signals\n")
         
         min_threshold = asset_performance.get('minimum_signals_threshold', 3)
-        report += f"""
+        parts.append(f"""
 📊 Analysis Criteria: Minimum {min_threshold} signals per asset for inclusion
-"""
+""")
         
-        return report
+        return ''.join(parts)
     
     def _generate_ml_insights_section(self, ml_predictions: Dict[str, Any]) -> str:
         """Generate ML insights section"""
         
-        report = f"""
-🤖 MACHINE LEARNING INSIGHTS
-{'='*35}
-"""
+        if not ml_predictions.get('model_available'):
+            return ''
         
-        model_performance = ml_predictions.get('model_performance', {})
+        parts = [_ML_INSIGHTS_HEADER]
+        
+        model_performance = ml_predictions.get('model_performance') or _EMPTY
         if model_performance:
-            train_score = model_performance.get('train_score', 0)
-            test_score = model_performance.get('test_score', 0)
-            sample_size = model_performance.get('sample_size', 0)
+            train_pct = float(model_performance.get('train_score', 0.0)) * 100.0
+            test_score = float(model_performance.get('test_score', 0.0))
+            test_pct = test_score * 100.0
+            sample_size = int(model_performance.get('sample_size', 0))
             
-            report += f"""
+            parts.append(f"""
 🎯 MODEL PERFORMANCE:
-• Training Accuracy: {train_score*100:.1f}%
-• Testing Accuracy: {test_score*100:.1f}%
+• Training Accuracy: {train_pct:.1f}%
+• Testing Accuracy: {test_pct:.1f}%
 • Sample Size: {sample_size:,} signals
 • Model Status: {'✅ Reliable' if test_score > 0.3 else '⚠️ Needs More Data'}
-"""
+""")
         
         # Feature importance
         feature_importance = ml_predictions.get('feature_importance', [])
         if feature_importance:
-            report += f"""
+            parts.append(f"""
 🔍 KEY PREDICTIVE FACTORS:
-"""
-            for i, feature_info in enumerate(feature_importance[:5], 1):
-                feature_name = feature_info.get('feature', 'Unknown')
-                importance = feature_info.get('importance', 0)
-                report += f"  {i}. {feature_name}: {importance*100:.1f}% importance\n"
-        
-        return report
+""")
+            top_features = [
+                (feature_info.get('feature', 'Unknown'), float(feature_info.get('importance', 0.0)) * 100.0)
+                for feature_info in islice(feature_importance, 5)
+            ]
+            parts.extend(
+                f"  {i}. {feature_name}: {importance_pct:.1f}% importance\n"
+                for i, (feature_name, importance_pct) in enumerate(top_features, 1)
+            )
+        
+        return ''.join(parts)
     
     def _generate_validation_section(self, validation_results: Dict[str, Any]) -> str:
         """Generate statistical validation section"""
         
-        report = f"""
-✅ STATISTICAL VALIDATION
-{'='*30}
-"""
+        parts = [_VALIDATION_HEADER]
         
-        checks = validation_results.get('checks', {})
+        checks = validation_results.get('checks') or _EMPTY
         
         # Sample size validation
         if 'sample_size' in checks:
             sample_check = checks['sample_size']
             status = "✅ Adequate" if sample_check.get('adequate') else "⚠️ Limited"
             
-            report += f"""
+            parts.append(f"""
 📊 DATA ADEQUACY:
 • Sample Size: {sample_check.get('value', 0)} signals
 • Status: {status}
 • Recommendation: {sample_check.get('recommendation', 'Continue analysis')}
-"""
+""")
         
         # Statistical significance
         if 'statistical_significance' in checks:
             sig_check = checks['statistical_significance']
             tests_performed = sig_check.get('tests_performed', [])
             significant_results = sig_check.get('significant_results', [])
+            validation_pct = float(validation_results.get('confidence_level', 0.95)) * 100.0
             
-            report += f"""
+            parts.append(f"""
 🔬 SIGNIFICANCE TESTING:
 • Tests Performed: {len(tests_performed)}
 • Significant Results: {len(significant_results)}
-• Validation Level: {validation_results.get('confidence_level', 0.95)*100:.0f}%
-"""
+• Validation Level: {validation_pct:.0f}%
+""")
         
-        return report
+        return ''.join(parts)
     
-    def _generate_recommendations_section(self, analysis_results: Dict[str, Any]) -> str:
+    def _generate_recommendations_section(self, metadata: Dict[str, Any], recommendations: Dict[str, Any],
+                                          confidence_pct: float) -> str:
         """Generate recommendations section"""
         
-        metadata = analysis_results.get('metadata', {})
         timezone = metadata.get('timezone', 'your timezone')
         
-        # Get key recommendations
-        opt_results = analysis_results.get('parameter_optimization', {})
-        recommendations = opt_results.get('recommendations', {})
-        
-        return f"""
-🎯 ENTERPRISE RECOMMENDATIONS
-{'='*35}
-
-🔥 IMMEDIATE ACTIONS:
-1. 📈 OPTIMAL TIMING: Focus trading during {recommendations.get('optimal_hour', 'peak')}:00 {timezone} time
-2. ⚖️ RISK MANAGEMENT: Use {recommendations.get('optimal_risk_range', 'configured')} risk levels
-3. 🕐 SESSION FOCUS: Prioritize {recommendations.get('optimal_session', 'identified')} market session
-4. 📊 MONITORING: Track performance metrics continuously
-
-💡 STRATEGIC INSIGHTS:
-• Risk-Reward Optimization: Data indicates optimal balance at specified parameters
-• Market Timing: Statistical analysis confirms time-based performance patterns
-• Asset Selection: Focus on top-performing categories and individual assets
-• Validation: All recommendations backed by {opt_results.get('confidence_level', 0.95)*100:.0f}% confidence level
-
-⚠️ RISK DISCLAIMERS:
-• Past performance does not guarantee future results
-• Market conditions can change rapidly
-• Recommendations based on historical data analysis
-• Consider current market context before implementation
-
-📋 MONITORING RECOMMENDATIONS:
-• Update analysis monthly with new signal data
-• Monitor for regime changes in market conditions
-• Validate performance against live trading results
-• Adjust parameters based on ongoing performance data
-
-"""
+        return _RECOMMENDATIONS_TEMPLATE.format_map({
+            'hour': recommendations.get('optimal_hour', 'peak'),
+            'timezone': timezone,
+            'risk_range': recommendations.get('optimal_risk_range', 'configured'),
+            'session': recommendations.get('optimal_session', 'identified'),
+            'confidence_pct': confidence_pct,
+        })
     
-    def _generate_footer(self) -> str:
+    def _generate_footer(self, timestamp: str) -> str:
         """Generate professional report footer"""
         
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        return f"""
-{'='*70}
-🏷️ REPORT METADATA
-• Generated by: Enterprise Trading Signal Analyzer v{self.config.get('app.version', '2.0.0')}
-• Analysis Engine: Statistical + Machine Learning Hybrid
-• Report Type: Comprehensive Professional Analysis
-• Generated: {timestamp}
-• Environment: {self.config.get('app.environment', 'Production')}
-
-📧 SUPPORT: For questions about this analysis or methodology
-🔄 UPDATES: Recommend monthly analysis updates for optimal results
-⚖️ COMPLIANCE: This analysis is for informational purposes only
-
-© 2025 Enterprise Trading Analytics Platform. All rights reserved.
-{'='*70}
-"""
\ No newline at end of file
+        return _FOOTER_TEMPLATE.format_map({
+            'version': self._app_version,
+            'timestamp': timestamp,
+            'environment': self._app_env,
+        })
@@ -5,15 +5,41 @@ Enterprise Configuration Manager
 Handles configuration loading, validation, and management for the enterprise platform.
 """
 
+import copy
 import yaml
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 import logging
 from dataclasses import dataclass
+from functools import cached_property
 
 logger = logging.getLogger(__name__)
 
+# Prefer the LibYAML-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+# Parsed YAML documents keyed by (path, mtime_ns, size)
+_YAML_CACHE: Dict[tuple, Any] = {}
+
+def _load_yaml(path: str) -> Any:
+    """Parse a YAML file, reusing the cached document while the file is unchanged"""
+    stat = os.stat(path)
+    cache_key = (path, stat.st_mtime_ns, stat.st_size)
+    
+    document = _YAML_CACHE.get(cache_key)
+    if document is None:
+        with open(path, 'r') as f:
+            document = yaml.load(f, Loader=_SafeLoader)
+        _YAML_CACHE[cache_key] = document
+    
+    # Callers merge overrides in place, so never hand out the cached object
+    return copy.deepcopy(document)
+
 @dataclass
 class TimezoneConfig:
     name: str
@@ -31,37 +57,58 @@ class ConfigManager:
     
     def __init__(self, config_path: Optional[str] = None):
         self.project_root = Path(__file__).parent.parent.parent
-        self.config_path = config_path or self.project_root / "config" / "default.yaml"
-        self.user_config_path = self.project_root / "config" / "user.yaml"
+        self.config_path = os.fspath(config_path or self.project_root / "config" / "default.yaml")
+        self.user_config_path = os.fspath(self.project_root / "config" / "user.yaml")
         self._config = None
+        self._flat: Dict[str, Any] = {}
         self._load_config()
     
     def _load_config(self):
         """Load configuration from YAML files"""
+        # Drop objects derived from a previously loaded config
+        self.__dict__.pop('timezones', None)
+        self.__dict__.pop('analysis_config', None)
+        
         try:
             # Load default config
-            with open(self.config_path, 'r') as f:
-                self._config = yaml.safe_load(f)
+            self._config = _load_yaml(self.config_path)
             
             # Override with user config if exists
-            if self.user_config_path.exists():
-                with open(self.user_config_path, 'r') as f:
-                    user_config = yaml.safe_load(f)
-                    self._merge_configs(self._config, user_config)
+            if os.path.isfile(self.user_config_path):
+                user_config = _load_yaml(self.user_config_path)
+                self._merge_configs(self._config, user_config)
             
             logger.info(f"Configuration loaded from {self.config_path}")
             
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}")
             self._config = self._get_default_config()
+        
+        self._flat = self._flatten(self._config or {})
+    
+    def _flatten(self, config: dict) -> Dict[str, Any]:
+        """Map every dot notation key, leaf or subtree, to its value"""
+        flat = {}
+        stack = [('', config)]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                path = f"{prefix}{key}"
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((f"{path}.", value))
+        return flat
     
     def _merge_configs(self, base_config: dict, override_config: dict):
-        """Recursively merge user config into base config"""
-        for key, value in override_config.items():
-            if key in base_config and isinstance(base_config[key], dict) and isinstance(value, dict):
-                self._merge_configs(base_config[key], value)
-            else:
-                base_config[key] = value
+        """Merge user config into base config, descending into nested sections"""
+        stack = [(base_config, override_config)]
+        while stack:
+            base, override = stack.pop()
+            for key, value in override.items():
+                if key in base and isinstance(base[key], dict) and isinstance(value, dict):
+                    stack.append((base[key], value))
+                else:
+                    base[key] = value
     
     def _get_default_config(self) -> dict:
         """Fallback default configuration"""
@@ -87,19 +134,15 @@ class ConfigManager:
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by dot notation key"""
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
     
     def get_timezones(self) -> Dict[str, TimezoneConfig]:
         """Get supported timezones as TimezoneConfig objects"""
+        return self.timezones
+    
+    @cached_property
+    def timezones(self) -> Dict[str, TimezoneConfig]:
+        """Supported timezones, built once per loaded config"""
         timezones = {}
         for tz_data in self.get('timezones.supported', []):
             timezones[tz_data['name']] = TimezoneConfig(
@@ -111,6 +154,11 @@ class ConfigManager:
     
     def get_analysis_config(self) -> AnalysisConfig:
         """Get analysis configuration"""
+        return self.analysis_config
+    
+    @cached_property
+    def analysis_config(self) -> AnalysisConfig:
+        """Analysis configuration, built once per loaded config"""
         return AnalysisConfig(
             risk_ranges=self.get('analysis.risk_ranges', []),
             confidence_levels=self.get('analysis.confidence_levels', [0.95]),
@@ -143,17 +191,21 @@ class ConfigManager:
     def save_user_config(self, config_updates: dict):
         """Save user-specific configuration overrides"""
         try:
-            self.user_config_path.parent.mkdir(exist_ok=True)
+            os.makedirs(os.path.dirname(self.user_config_path), exist_ok=True)
             with open(self.user_config_path, 'w') as f:
-                yaml.dump(config_updates, f, default_flow_style=False)
+                yaml.dump(config_updates, f, Dumper=_SafeDumper, default_flow_style=False)
             logger.info(f"User configuration saved to {self.user_config_path}")
         except Exception as e:
             logger.error(f"Failed to save user configuration: {e}")
     
     @property
-    def config(self) -> dict:
-        """Get full configuration dictionary"""
-        return self._config.copy()
+    def config(self) -> Mapping[str, Any]:
+        """Get read-only view of the full configuration dictionary"""
+        return MappingProxyType(self._config)
+    
+    def snapshot(self) -> dict:
+        """Get an independent deep copy of the full configuration dictionary"""
+        return copy.deepcopy(self._config)
     
     def __str__(self) -> str:
         return f"ConfigManager(app={self.get('app.name')}, env={self.get('app.environment')})"
\ No newline at end of file
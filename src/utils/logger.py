@@ -5,12 +5,149 @@ Enterprise Logging System
 Professional logging setup with rotation, formatting, and multiple handlers.
 """
 
+import atexit
+import functools
 import logging
 import logging.handlers
 import os
+import queue
+import sys
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Iterable, Optional, Dict
 from datetime import datetime
+from time import perf_counter
+
+# Log directory at the project root, resolved once per process
+_LOGS_DIR = Path(__file__).resolve().parent.parent.parent / "logs"
+_LOGS_DIR.mkdir(exist_ok=True)
+
+# Shared queue drained by a single background listener that owns the real
+# console/file handlers, so callers only pay for an enqueue per record
+_LOG_QUEUE: queue.Queue = queue.Queue(-1)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _RoutedQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that tags each record with the handlers that should emit it"""
+
+    def __init__(self, log_queue: queue.Queue, targets: Iterable[logging.Handler]):
+        super().__init__(log_queue)
+        self.targets = tuple(targets)
+
+    def enqueue(self, record: logging.LogRecord):
+        self.queue.put_nowait((self.targets, record))
+
+
+class _RoutingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that dispatches each record to its own logger's handlers"""
+
+    def handle(self, item):
+        targets, record = item
+        for handler in targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def _start_queue_listener():
+    """Start the shared background listener once per process"""
+    global _queue_listener
+    if _queue_listener is None:
+        _queue_listener = _RoutingQueueListener(_LOG_QUEUE)
+        _queue_listener.start()
+
+
+def _stop_queue_listener():
+    """Flush queued records and stop the background listener"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+def _attach_queued_handlers(logger: logging.Logger, handlers: Iterable[logging.Handler]):
+    """Attach handlers to a logger behind the shared queue"""
+    logger.addHandler(_RoutedQueueHandler(_LOG_QUEUE, handlers))
+    _start_queue_listener()
+
+
+def _close_handlers(logger: logging.Logger):
+    """Detach and close a logger's handlers, draining queued records first"""
+    if logger.handlers:
+        _stop_queue_listener()
+        for handler in logger.handlers:
+            for target in getattr(handler, 'targets', (handler,)):
+                target.close()
+        logger.handlers.clear()
+
+
+# Size suffixes ordered longest-first so 'MB' is not matched by 'B'
+_UNITS = (('GB', 1 << 30), ('MB', 1 << 20), ('KB', 1 << 10), ('B', 1))
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_file_size(size_str: str) -> int:
+    """Parse size string like '10MB' to bytes"""
+    size_str = size_str.upper().strip()
+    
+    for unit, multiplier in _UNITS:
+        if size_str.endswith(unit):
+            # Extract the numeric part correctly
+            numeric_part = size_str[:-len(unit)]
+            try:
+                return int(numeric_part) * multiplier
+            except ValueError:
+                # If numeric part is empty or invalid, default to bytes
+                break
+    
+    # Default to bytes if no unit or invalid format
+    try:
+        return int(size_str)
+    except ValueError:
+        # Default fallback to 10MB
+        return 10 * 1024 * 1024
+
+
+def _build_file_handler(log_file: Path, max_bytes: int, backup_count: int,
+                        strategy: str = 'internal') -> logging.Handler:
+    """Create a log file handler for the configured rotation strategy
+    
+    'internal' rotates by size in-process, 'watched' leaves rotation to an
+    external tool such as logrotate, and 'syslog' hands records to the local
+    syslog daemon (falling back to internal rotation without /dev/log).
+    """
+    if strategy == 'watched':
+        return logging.handlers.WatchedFileHandler(log_file)
+    if strategy == 'syslog' and os.path.exists('/dev/log'):
+        return logging.handlers.SysLogHandler(
+            address='/dev/log',
+            facility=logging.handlers.SysLogHandler.LOG_LOCAL0
+        )
+    return logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=max_bytes,
+        backupCount=backup_count
+    )
+
+
+def _stderr_is_tty() -> bool:
+    """Whether console logging should be on by default"""
+    return sys.stderr is not None and sys.stderr.isatty()
+
+
+# Formatters are stateless, so loggers sharing a format share one instance
+_FORMATTER_CACHE: Dict[str, logging.Formatter] = {}
+
+
+def _get_formatter(fmt: str) -> logging.Formatter:
+    """Get the shared formatter for a format string"""
+    formatter = _FORMATTER_CACHE.get(fmt)
+    if formatter is None:
+        formatter = _FORMATTER_CACHE.setdefault(fmt, logging.Formatter(fmt))
+    return formatter
+
 
 class EnterpriseLogger:
     """Enterprise-grade logging with file rotation and structured output"""
@@ -28,105 +165,96 @@ class EnterpriseLogger:
             'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             'file_rotation': True,
             'max_file_size': '10MB',
-            'backup_count': 5
+            'backup_count': 5,
+            'rotation_strategy': 'internal',
+            'console': _stderr_is_tty()
         }
     
     def _setup_logger(self):
         """Setup logger with handlers and formatters"""
-        # Clear existing handlers
-        self.logger.handlers.clear()
+        level_name = self.config.get('level', 'INFO').upper()
+        fmt = self.config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_rotation = self.config.get('file_rotation', True)
+        max_file_size = self.config.get('max_file_size', '10MB')
+        backup_count = self.config.get('backup_count', 5)
+        rotation_strategy = self.config.get('rotation_strategy', 'internal')
+        console = self.config.get('console', _stderr_is_tty())
+        
+        # Already configured identically - keep the open handlers
+        signature = (level_name, fmt, file_rotation, max_file_size, backup_count, rotation_strategy, console)
+        if self.logger.handlers and getattr(self.logger, '_enterprise_sig', None) == signature:
+            return
+        
+        # Close existing handlers, draining queued records first
+        _close_handlers(self.logger)
         
         # Set level
-        level = getattr(logging, self.config.get('level', 'INFO').upper())
+        level = getattr(logging, level_name)
         self.logger.setLevel(level)
         
         # Create formatter
-        formatter = logging.Formatter(
-            self.config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        )
+        formatter = _get_formatter(fmt)
         
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(level)
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        # Console handler, only when interactive or explicitly requested
+        handlers = []
+        if console:
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(level)
+            console_handler.setFormatter(formatter)
+            handlers.append(console_handler)
         
         # File handler with rotation
-        if self.config.get('file_rotation', True):
-            logs_dir = Path(__file__).parent.parent.parent / "logs"
-            logs_dir.mkdir(exist_ok=True)
-            
-            log_file = logs_dir / f"{self.name}.log"
+        if file_rotation:
+            log_file = _LOGS_DIR / f"{self.name}.log"
             
             # Parse file size (e.g., "10MB" -> 10485760 bytes)
-            max_size = self._parse_file_size(self.config.get('max_file_size', '10MB'))
-            backup_count = self.config.get('backup_count', 5)
+            max_size = _parse_file_size(max_file_size)
             
-            file_handler = logging.handlers.RotatingFileHandler(
-                log_file,
-                maxBytes=max_size,
-                backupCount=backup_count
-            )
+            file_handler = _build_file_handler(log_file, max_size, backup_count, rotation_strategy)
             file_handler.setLevel(level)
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        # Emit from the background listener rather than the calling thread
+        _attach_queued_handlers(self.logger, handlers)
         
         # Prevent propagation to root logger
         self.logger.propagate = False
-    
-    def _parse_file_size(self, size_str: str) -> int:
-        """Parse size string like '10MB' to bytes"""
-        units = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3}
-        size_str = size_str.upper().strip()
-        
-        for unit, multiplier in units.items():
-            if size_str.endswith(unit):
-                # Extract the numeric part correctly
-                numeric_part = size_str[:-len(unit)]
-                try:
-                    return int(numeric_part) * multiplier
-                except ValueError:
-                    # If numeric part is empty or invalid, default to bytes
-                    break
-        
-        # Default to bytes if no unit or invalid format
-        try:
-            return int(size_str)
-        except ValueError:
-            # Default fallback to 10MB
-            return 10 * 1024 * 1024
+        self.logger._enterprise_sig = signature
     
     def get_logger(self) -> logging.Logger:
         """Get the configured logger instance"""
         return self.logger
 
+# Default loggers for different modules
+_DEFAULT_LOGGER_NAMES = ('analyzer', 'data_processor', 'ml_engine', 'exporter', 'config', 'main')
+_DEFAULT_LEVELS = {'data_processor': 'DEBUG'}
+
 def setup_enterprise_logging(config: Optional[Dict] = None) -> Dict[str, logging.Logger]:
     """Setup enterprise logging for all modules"""
     config = config or {}
+    _start_queue_listener()
     
-    # Default loggers for different modules
-    loggers = {}
-    
-    logger_configs = {
-        'analyzer': config.get('loggers', {}).get('analyzer', 'INFO'),
-        'data_processor': config.get('loggers', {}).get('data_processor', 'DEBUG'),
-        'ml_engine': config.get('loggers', {}).get('ml_engine', 'INFO'),
-        'exporter': config.get('loggers', {}).get('exporter', 'INFO'),
-        'config': config.get('loggers', {}).get('config', 'INFO'),
-        'main': config.get('loggers', {}).get('main', 'INFO')
+    # Settings shared by every module logger; only the level differs
+    level_overrides = config.get('loggers', {})
+    shared_config = {
+        'format': config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
+        'file_rotation': config.get('file_rotation', True),
+        'max_file_size': config.get('max_file_size', '10MB'),
+        'backup_count': config.get('backup_count', 5),
+        'rotation_strategy': config.get('rotation_strategy', 'internal'),
+        'console': config.get('console', _stderr_is_tty())
     }
     
+    # Audit and performance logs are created at import time; switch them to the configured rotation
+    audit_logger.configure(shared_config['rotation_strategy'])
+    performance_logger.configure(shared_config['rotation_strategy'])
+    
     # Create loggers
-    for logger_name, level in logger_configs.items():
-        logger_config = {
-            'level': level,
-            'format': config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
-            'file_rotation': config.get('file_rotation', True),
-            'max_file_size': config.get('max_file_size', '10MB'),
-            'backup_count': config.get('backup_count', 5)
-        }
-        
-        enterprise_logger = EnterpriseLogger(logger_name, logger_config)
+    loggers = {}
+    for logger_name in _DEFAULT_LOGGER_NAMES:
+        level = level_overrides.get(logger_name) or _DEFAULT_LEVELS.get(logger_name, 'INFO')
+        enterprise_logger = EnterpriseLogger(logger_name, {**shared_config, 'level': level})
         loggers[logger_name] = enterprise_logger.get_logger()
     
     return loggers
@@ -138,48 +266,47 @@ class AuditLogger:
         self.logger = logging.getLogger('audit')
         self._setup_audit_logger()
     
-    def _setup_audit_logger(self):
+    def configure(self, rotation_strategy: str = 'internal'):
+        """Rebuild the log file handler for a rotation strategy from the logging config"""
+        self._setup_audit_logger(rotation_strategy)
+    
+    def _setup_audit_logger(self, rotation_strategy: str = 'internal'):
         """Setup audit logger with special formatting"""
-        if self.logger.handlers:
+        if self.logger.handlers and getattr(self.logger, '_rotation_strategy', None) == rotation_strategy:
             return  # Already configured
+        _close_handlers(self.logger)
         
         # Audit logs have special format
-        formatter = logging.Formatter(
+        formatter = _get_formatter(
             '%(asctime)s - AUDIT - %(levelname)s - %(message)s'
         )
         
         # File handler for audit trail
-        logs_dir = Path(__file__).parent.parent.parent / "logs"
-        logs_dir.mkdir(exist_ok=True)
-        
-        audit_file = logs_dir / "audit.log"
-        file_handler = logging.handlers.RotatingFileHandler(
-            audit_file,
-            maxBytes=50*1024*1024,  # 50MB
-            backupCount=10
-        )
+        audit_file = _LOGS_DIR / "audit.log"
+        file_handler = _build_file_handler(audit_file, 50*1024*1024, 10, rotation_strategy)  # 50MB
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(formatter)
         
-        self.logger.addHandler(file_handler)
+        _attach_queued_handlers(self.logger, (file_handler,))
         self.logger.setLevel(logging.INFO)
         self.logger.propagate = False
+        self.logger._rotation_strategy = rotation_strategy
     
     def log_analysis_start(self, user: str, timezone: str, data_file: str):
         """Log analysis start for audit"""
-        self.logger.info(f"ANALYSIS_START - User: {user}, Timezone: {timezone}, Data: {data_file}")
+        self.logger.info("ANALYSIS_START - User: %s, Timezone: %s, Data: %s", user, timezone, data_file)
     
     def log_analysis_complete(self, user: str, duration: float, signals_count: int):
         """Log analysis completion for audit"""
-        self.logger.info(f"ANALYSIS_COMPLETE - User: {user}, Duration: {duration:.2f}s, Signals: {signals_count}")
+        self.logger.info("ANALYSIS_COMPLETE - User: %s, Duration: %.2fs, Signals: %s", user, duration, signals_count)
     
     def log_export(self, user: str, file_type: str, file_path: str):
         """Log data export for audit"""
-        self.logger.info(f"DATA_EXPORT - User: {user}, Type: {file_type}, Path: {file_path}")
+        self.logger.info("DATA_EXPORT - User: %s, Type: %s, Path: %s", user, file_type, file_path)
     
     def log_config_change(self, user: str, parameter: str, old_value: str, new_value: str):
         """Log configuration changes for audit"""
-        self.logger.info(f"CONFIG_CHANGE - User: {user}, Parameter: {parameter}, Old: {old_value}, New: {new_value}")
+        self.logger.info("CONFIG_CHANGE - User: %s, Parameter: %s, Old: %s, New: %s", user, parameter, old_value, new_value)
 
 class PerformanceLogger:
     """Logger for performance monitoring and metrics"""
@@ -188,42 +315,41 @@ class PerformanceLogger:
         self.logger = logging.getLogger('performance')
         self._setup_performance_logger()
     
-    def _setup_performance_logger(self):
+    def configure(self, rotation_strategy: str = 'internal'):
+        """Rebuild the log file handler for a rotation strategy from the logging config"""
+        self._setup_performance_logger(rotation_strategy)
+    
+    def _setup_performance_logger(self, rotation_strategy: str = 'internal'):
         """Setup performance logger"""
-        if self.logger.handlers:
+        if self.logger.handlers and getattr(self.logger, '_rotation_strategy', None) == rotation_strategy:
             return
+        _close_handlers(self.logger)
         
-        formatter = logging.Formatter(
+        formatter = _get_formatter(
             '%(asctime)s - PERF - %(message)s'
         )
         
-        logs_dir = Path(__file__).parent.parent.parent / "logs"
-        logs_dir.mkdir(exist_ok=True)
-        
-        perf_file = logs_dir / "performance.log"
-        file_handler = logging.handlers.RotatingFileHandler(
-            perf_file,
-            maxBytes=20*1024*1024,  # 20MB
-            backupCount=5
-        )
+        perf_file = _LOGS_DIR / "performance.log"
+        file_handler = _build_file_handler(perf_file, 20*1024*1024, 5, rotation_strategy)  # 20MB
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(formatter)
         
-        self.logger.addHandler(file_handler)
+        _attach_queued_handlers(self.logger, (file_handler,))
         self.logger.setLevel(logging.INFO)
         self.logger.propagate = False
+        self.logger._rotation_strategy = rotation_strategy
     
     def log_timing(self, operation: str, duration: float, details: str = ""):
         """Log operation timing"""
-        self.logger.info(f"TIMING - {operation}: {duration:.3f}s {details}")
+        self.logger.info("TIMING - %s: %.3fs %s", operation, duration, details)
     
     def log_memory_usage(self, operation: str, memory_mb: float):
         """Log memory usage"""
-        self.logger.info(f"MEMORY - {operation}: {memory_mb:.2f}MB")
+        self.logger.info("MEMORY - %s: %.2fMB", operation, memory_mb)
     
     def log_data_stats(self, operation: str, records_processed: int, rate_per_sec: float):
         """Log data processing statistics"""
-        self.logger.info(f"DATA_STATS - {operation}: {records_processed} records, {rate_per_sec:.2f} rec/sec")
+        self.logger.info("DATA_STATS - %s: %s records, %.2f rec/sec", operation, records_processed, rate_per_sec)
 
 # Global logger instances
 audit_logger = AuditLogger()
@@ -235,20 +361,23 @@ def get_logger(name: str) -> logging.Logger:
 
 def log_timing(func):
     """Decorator to log function execution time"""
-    import time
-    import functools
+    perf_logger = performance_logger.logger
+    name = func.__name__
+    error_name = name + "_ERROR"
     
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        # Skip the clock reads entirely when timings would be dropped
+        if not perf_logger.isEnabledFor(logging.INFO):
+            return func(*args, **kwargs)
+        
+        start_time = perf_counter()
         try:
             result = func(*args, **kwargs)
-            duration = time.time() - start_time
-            performance_logger.log_timing(func.__name__, duration)
-            return result
         except Exception as e:
-            duration = time.time() - start_time
-            performance_logger.log_timing(f"{func.__name__}_ERROR", duration, str(e))
+            performance_logger.log_timing(error_name, perf_counter() - start_time, e)
             raise
+        performance_logger.log_timing(name, perf_counter() - start_time)
+        return result
     
-    return wrapper
\ No newline at end of file
+    return wrapper
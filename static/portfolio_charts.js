@@ -0,0 +1,45 @@
+// Portfolio summary charts: results distribution and cumulative P&L
+function initCharts(resultCounts, pnlSeries) {
+    // Results distribution chart
+    const resultsCtx = document.getElementById('resultsChart').getContext('2d');
+    new Chart(resultsCtx, {
+        type: 'doughnut',
+        data: {
+            labels: ['Losses', 'Profits', 'Neither'],
+            datasets: [{
+                data: resultCounts,
+                backgroundColor: ['#dc3545', '#28a745', '#ffc107']
+            }]
+        },
+        options: {
+            responsive: true,
+            plugins: {
+                legend: { position: 'bottom' }
+            }
+        }
+    });
+    
+    // P&L over time chart
+    const pnlCtx = document.getElementById('pnlChart').getContext('2d');
+    const pnlData = pnlSeries.map((y, index) => ({x: index + 1, y}));
+    
+    new Chart(pnlCtx, {
+        type: 'line',
+        data: {
+            datasets: [{
+                label: 'Cumulative P&L',
+                data: pnlData,
+                borderColor: '#dc3545',
+                backgroundColor: 'rgba(220, 53, 69, 0.1)',
+                fill: true
+            }]
+        },
+        options: {
+            responsive: true,
+            scales: {
+                x: { title: { display: true, text: 'Trade Number' } },
+                y: { title: { display: true, text: 'Cumulative P&L ($)' } }
+            }
+        }
+    });
+}
@@ -2,21 +2,24 @@
 """
 Quick API test to check if Binance connection is working
 """
+import os
 import sys
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-# Load environment variables from .env file
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+# Load environment variables from .env file unless already provided
+if not os.getenv('BINANCE_API_KEY'):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
 
 from crypto_analyzer import BinanceClient
 from crypto_analyzer.models import TradingSignal
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import pandas as pd
 
@@ -45,26 +48,30 @@ def test_api_connection():
             'DOGEUSDT'
         ]
         
-        for symbol in test_symbols:
-            print(f"   Testing {symbol}...")
-            try:
-                # Try to get just 1 candle for the last day
-                start_time = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-                df = client.get_klines_for_timeframe(
-                    symbol=symbol,
-                    start_dt=start_time,
-                    interval='1d',
-                    limit=1
-                )
-                
-                if df is not None and not df.empty:
-                    price = df.iloc[0]['close']
-                    print(f"     ✅ {symbol}: ${price}")
-                else:
-                    print(f"     ❌ {symbol}: No data returned")
+        # Try to get just 1 candle for the last day
+        start_time = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        get_klines = client.get_klines_for_timeframe
+        
+        # Fetch all symbols concurrently; results are reported in list order
+        with ThreadPoolExecutor(max_workers=len(test_symbols)) as executor:
+            futures = [
+                executor.submit(get_klines, symbol=symbol, start_dt=start_time, interval='1d', limit=1)
+                for symbol in test_symbols
+            ]
+            
+            for symbol, future in zip(test_symbols, futures):
+                print(f"   Testing {symbol}...")
+                try:
+                    df = future.result()
                     
-            except Exception as e:
-                print(f"     ❌ {symbol}: {str(e)}")
+                    if df is not None and not df.empty:
+                        price = df.iloc[0]['close']
+                        print(f"     ✅ {symbol}: ${price}")
+                    else:
+                        print(f"     ❌ {symbol}: No data returned")
+                        
+                except Exception as e:
+                    print(f"     ❌ {symbol}: {str(e)}")
         
         return True
         
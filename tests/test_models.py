@@ -36,6 +36,54 @@ class TestTradingSignal:
         assert signal.date == "2023-01-01"
         assert signal.time == "12:00:00"
 
+    def test_batch_from_dataframe(self):
+        """Test creating TradingSignals from a whole CSV DataFrame"""
+        df = pd.DataFrame({
+            'timestamp_utc': ['2023-01-01 12:00:00', '2023-01-02 08:30:00', '2023-01-03 00:00:00'],
+            'coin': ['btc', 'eth', 'doge'],
+            'entry': [50000.0, '', ''],
+            'sl': [45000.0, 1500.0, None]
+        })
+
+        signals = TradingSignal.batch_from_dataframe(df)
+        expected = []
+        for _, row in df.iterrows():
+            try:
+                expected.append(TradingSignal.from_csv_row(row))
+            except ValueError:
+                pass
+
+        assert signals == expected
+        assert [s.coin_name for s in signals] == ["BTC", "ETH"]
+        assert signals[1].entry_price == 1500.0
+        assert signals[1].time == "08:30:00"
+
+    def test_frame_from_dataframe(self):
+        """Test parsing CSV rows into signal columns without creating objects"""
+        df = pd.DataFrame({
+            'timestamp_utc': ['2023-01-01 12:00:00', 'not a date', '2023-01-03 00:00:00'],
+            'coin': ['btc', 'eth', 'bananas31'],
+            'entry': [50000.0, 1500.0, 2.0]
+        })
+
+        signals = TradingSignal.frame_from_dataframe(df)
+        assert signals['coin_name'].tolist() == ["BTC", "BANANAS31"]
+        assert signals['date'].tolist() == ["2023-01-01", "2023-01-03"]
+        assert [TradingSignal.symbol_for(coin) for coin in signals['coin_name']] == ["BTCUSDT", "BANANASUSDT"]
+
+    def test_frame_from_dataframe_mixed_timestamp_formats(self):
+        """Test that every timestamp format from_csv_row accepts is kept"""
+        df = pd.DataFrame({
+            'timestamp_utc': ['2023-01-01 12:00:00', '2023-01-02T08:30:00+04:00', '01/03/2023 10:00'],
+            'coin': ['btc', 'eth', 'sol'],
+            'entry': [50000.0, 1500.0, 20.0]
+        })
+
+        signals = TradingSignal.frame_from_dataframe(df)
+        assert signals['coin_name'].tolist() == ["BTC", "ETH", "SOL"]
+        assert signals['time'].tolist() == ["12:00:00", "04:30:00", "10:00:00"]
+        assert list(signals['timestamp']) == [TradingSignal.from_csv_row(row).timestamp for _, row in df.iterrows()]
+
 
 class TestAnalysisResult:
     """Test cases for AnalysisResult model"""
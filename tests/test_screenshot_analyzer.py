@@ -0,0 +1,69 @@
+"""Tests for the TradingView screenshot analyzer's price data handling"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("selenium")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from crypto_analyzer import TradingSignal
+from tradingview_screenshot_analyzer import TradingViewScreenshotAnalyzer
+
+
+class FakeKlinesResponse:
+    """Binance klines response holding already-built candle rows"""
+
+    def __init__(self, rows):
+        self.content = str(rows).replace("'", '"').encode()
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeKlinesSession:
+    """Serves 1-minute candles like Binance: open times from startTime to endTime, at most `limit`"""
+
+    def __init__(self, price_at):
+        self.price_at = price_at
+
+    def get(self, url, params, timeout):
+        first = -(-params['startTime'] // 60000) * 60000
+        open_times = range(first, params['endTime'] + 1, 60000)[:params['limit']]
+        return FakeKlinesResponse([
+            [t, self.price_at(t), self.price_at(t), self.price_at(t), self.price_at(t)] for t in open_times
+        ])
+
+
+class TestPrefetchKlines:
+    """Test cases for prefetching signal windows once per symbol"""
+
+    def test_prefetch_matches_direct_fetch_for_signals_with_seconds(self, tmp_path, monkeypatch):
+        """Prefetched candles stay within each signal's own request span"""
+        monkeypatch.chdir(tmp_path)
+        signals = [
+            TradingSignal(timestamp=datetime(2024, 3, 1, 10, 0, 30), coin_name="BTC", entry_price=100.0),
+            TradingSignal(timestamp=datetime(2024, 3, 3, 12, 0, 30), coin_name="BTC", entry_price=100.0),
+        ]
+        # Price crashes between the two signals, after the first signal's span ends
+        crash_ms = int(pd.Timestamp(2024, 3, 3, 12, 0).timestamp() * 1000)
+
+        def price_at(open_time):
+            return 50.0 if open_time >= crash_ms else 100.0
+
+        direct = TradingViewScreenshotAnalyzer()
+        direct._session = FakeKlinesSession(price_at)
+        expected = [direct.analyze_trade_outcome(signal) for signal in signals]
+
+        prefetched = TradingViewScreenshotAnalyzer()
+        prefetched._session = FakeKlinesSession(price_at)
+        prefetched._prefetch_klines(signals)
+        results = [prefetched.analyze_trade_outcome(signal) for signal in signals]
+
+        assert results == expected
+        assert results[0]['outcome'] == 'ongoing'
+        assert results[0]['final_price'] == 100.0
@@ -1,5 +1,6 @@
 """Tests for utility functions"""
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import datetime, timezone
 import tempfile
@@ -7,6 +8,7 @@ import os
 
 from crypto_analyzer.utils import (
     floor_to_timeframe,
+    floor_to_timeframe_array,
     validate_csv_file,
     load_and_validate_csv,
     generate_output_filename
@@ -36,6 +38,19 @@ class TestUtilityFunctions:
         result = floor_to_timeframe(dt, 60)
         assert result.minute == 0
     
+    def test_floor_to_timeframe_array(self):
+        """Test vectorised flooring matches the scalar version"""
+        timestamps = pd.date_range('2023-01-01', periods=500, freq='17min', tz='UTC')
+        values = timestamps.tz_convert(None).to_numpy()
+        
+        for minutes in (1, 5, 15, 60, 240, 1440):
+            result = floor_to_timeframe_array(values, minutes)
+            expected = [
+                np.datetime64(floor_to_timeframe(ts.to_pydatetime(), minutes).replace(tzinfo=None), 'ns')
+                for ts in timestamps
+            ]
+            assert (result == np.array(expected)).all()
+    
     def test_validate_csv_file(self):
         """Test CSV file validation"""
         # Valid CSV
@@ -1,304 +1,705 @@
-#!/usr/bin/env python3
-"""
-Trade Visualization Tool
-Creates charts showing trade entries, exits, and price action
-"""
-import sys
-from pathlib import Path
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from datetime import datetime, timedelta
-import numpy as np
-import os
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
-
-from crypto_analyzer import BinanceClient
-import logging
-
-logger = logging.getLogger(__name__)
-
-
-class TradeVisualizer:
-    """Visualize individual trades with price action"""
-    
-    def __init__(self):
-        self.client = BinanceClient()
-        
-    def visualize_trade(
-        self, 
-        symbol: str, 
-        entry_time: datetime, 
-        entry_price: float,
-        stop_loss_price: float,
-        take_profit_price: float,
-        actual_exit_time: datetime = None,
-        actual_exit_price: float = None,
-        exit_reason: str = None,
-        days_before: int = 2,
-        days_after: int = 5
-    ):
-        """
-        Create a chart showing the trade with entry, SL, TP, and actual exit
-        
-        Args:
-            symbol: Trading symbol (e.g., 'BTCUSDT')
-            entry_time: When the trade was entered
-            entry_price: Entry price
-            stop_loss_price: Stop loss price
-            take_profit_price: Take profit price
-            actual_exit_time: When trade actually exited (if known)
-            actual_exit_price: Actual exit price (if known)
-            exit_reason: Reason for exit ('PROFIT', 'LOSS', 'BREAKEVEN', etc.)
-            days_before: Days of price history before entry
-            days_after: Days of price history after entry
-        """
-        try:
-            # Calculate time range
-            start_time = entry_time - timedelta(days=days_before)
-            end_time = entry_time + timedelta(days=days_after)
-            
-            # Get price data using the correct method
-            print(f"📊 Getting price data for {symbol}...")
-            
-            # Calculate how many hours of data we need
-            total_hours = int((end_time - start_time).total_seconds() / 3600) + 24
-            
-            # Use the BinanceClient's method
-            df = self.client.get_klines_for_timeframe(
-                symbol=symbol,
-                start_dt=start_time,
-                interval=self.client.client.KLINE_INTERVAL_1HOUR,
-                limit=min(total_hours, 1000)  # Binance API limit
-            )
-            
-            if df is None or len(df) == 0:
-                print(f"❌ No price data found for {symbol}")
-                return
-                
-            # Create the chart
-            fig, ax1 = plt.subplots(1, 1, figsize=(15, 10))
-            
-            # Price chart - df already has timestamp as index
-            ax1.plot(df.index, df['close'], 'b-', linewidth=1, label='Price', alpha=0.8)
-            
-            # Entry point
-            ax1.axvline(x=entry_time, color='green', linestyle='--', alpha=0.7, label='Entry Time')
-            ax1.axhline(y=entry_price, color='green', linestyle='-', alpha=0.7, label=f'Entry: ${entry_price:.4f}')
-            
-            # Stop Loss and Take Profit levels
-            ax1.axhline(y=stop_loss_price, color='red', linestyle='-', alpha=0.7, label=f'Stop Loss: ${stop_loss_price:.4f}')
-            ax1.axhline(y=take_profit_price, color='blue', linestyle='-', alpha=0.7, label=f'Take Profit: ${take_profit_price:.4f}')
-            
-            # Actual exit (if provided)
-            if actual_exit_time and actual_exit_price:
-                color = 'green' if exit_reason == 'PROFIT' else 'red' if exit_reason == 'LOSS' else 'orange'
-                ax1.axvline(x=actual_exit_time, color=color, linestyle=':', alpha=0.7, label=f'Exit Time ({exit_reason})')
-                ax1.scatter([actual_exit_time], [actual_exit_price], color=color, s=100, zorder=5, label=f'Exit: ${actual_exit_price:.4f}')
-            
-            # Fill areas
-            ax1.fill_between(df.index, stop_loss_price, take_profit_price, alpha=0.1, color='gray', label='Trade Range')
-            
-            # Formatting
-            ax1.set_title(f'{symbol} Trade Analysis\nEntry: {entry_time.strftime("%Y-%m-%d %H:%M")} at ${entry_price:.4f}', fontsize=14, fontweight='bold')
-            ax1.set_ylabel('Price (USDT)', fontweight='bold')
-            ax1.set_xlabel('Time', fontweight='bold')
-            ax1.legend(loc='upper left')
-            ax1.grid(True, alpha=0.3)
-            
-            # Format x-axis
-            ax1.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d %H:%M'))
-            ax1.xaxis.set_major_locator(mdates.HourLocator(interval=12))
-            plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45)
-            
-            plt.tight_layout()
-            
-            # Save chart
-            filename = f"trade_chart_{symbol}_{entry_time.strftime('%Y%m%d_%H%M%S')}.png"
-            plt.savefig(filename, dpi=300, bbox_inches='tight')
-            print(f"✅ Chart saved as: {filename}")
-            
-            # Show chart
-            plt.show()
-            
-        except Exception as e:
-            logger.error(f"Error creating chart for {symbol}: {e}")
-            
-    def visualize_from_csv(self, csv_file: str, max_charts: int = 10):
-        """
-        Create charts for trades from a CSV results file
-        
-        Args:
-            csv_file: Path to CSV file with trade results
-            max_charts: Maximum number of charts to create
-        """
-        try:
-            df = pd.read_csv(csv_file)
-            print(f"📊 Found {len(df)} trades in {csv_file}")
-            
-            # Check column names to handle different CSV formats
-            print(f"📋 Columns found: {list(df.columns)}")
-            
-            if max_charts < len(df):
-                print(f"📈 Creating charts for first {max_charts} trades...")
-                df = df.head(max_charts)
-            
-            for idx, row in df.iterrows():
-                print(f"\n🎯 Creating chart {idx + 1}/{len(df)}...")
-                
-                try:
-                    # Handle different CSV formats
-                    if 'Signal_Date' in df.columns and 'Signal_Time' in df.columns:
-                        # Concurrent portfolio format
-                        symbol = row['Coin'] + 'USDT' if not row['Coin'].endswith('USDT') else row['Coin']
-                        entry_time = pd.to_datetime(f"{row['Signal_Date']} {row['Signal_Time']}")
-                        entry_price = float(row['Entry_Fill_Price']) if 'Entry_Fill_Price' in row else float(row['Limit_Price'])
-                        
-                        # Extract exit information
-                        exit_time = pd.to_datetime(row['Close_Time']) if pd.notna(row['Close_Time']) else None
-                        exit_reason = row['Close_Reason'] if 'Close_Reason' in row else 'UNKNOWN'
-                        pnl = float(row['PnL']) if 'PnL' in row and pd.notna(row['PnL']) else 0
-                        
-                    elif 'Date' in df.columns and 'Time' in df.columns:
-                        # Regular portfolio format
-                        symbol = row['Coin'] + 'USDT' if not row['Coin'].endswith('USDT') else row['Coin']
-                        entry_time = pd.to_datetime(f"{row['Date']} {row['Time']}")
-                        entry_price = float(row['Entry_Price'])
-                        
-                        # Determine exit info if available
-                        exit_time = None
-                        exit_reason = row.get('Outcome', 'UNKNOWN')
-                        pnl = float(row['PnL']) if 'PnL' in row and pd.notna(row['PnL']) else 0
-                        
-                        if 'Hours_to_Hit' in row and pd.notna(row['Hours_to_Hit']):
-                            exit_time = entry_time + timedelta(hours=float(row['Hours_to_Hit']))
-                    else:
-                        print(f"❌ Unsupported CSV format. Expected columns: Signal_Date/Date, Signal_Time/Time, Coin, etc.")
-                        continue
-                    
-                    # Calculate SL and TP based on available data or defaults
-                    if 'Risk_Amount' in row and pd.notna(row['Risk_Amount']):
-                        # Calculate from risk amount (assuming 10% default SL)
-                        risk_amount = float(row['Risk_Amount'])
-                        stop_loss_pct = 10  # Default assumption
-                        risk_reward = 1.5   # Default assumption
-                        
-                        stop_loss_price = entry_price * (1 - stop_loss_pct / 100)
-                        take_profit_price = entry_price * (1 + (stop_loss_pct * risk_reward) / 100)
-                    else:
-                        # Use default calculations
-                        stop_loss_pct = 10
-                        risk_reward = 1.5
-                        stop_loss_price = entry_price * (1 - stop_loss_pct / 100)
-                        take_profit_price = entry_price * (1 + (stop_loss_pct * risk_reward) / 100)
-                    
-                    # Determine exit price if not available
-                    exit_price = None
-                    if exit_time and exit_reason:
-                        if exit_reason in ['PROFIT', 'WIN']:
-                            exit_price = take_profit_price
-                        elif exit_reason in ['LOSS', 'STOP']:
-                            exit_price = stop_loss_price
-                        elif exit_reason == 'BREAKEVEN':
-                            exit_price = entry_price
-                        elif pnl != 0:
-                            # Try to calculate exit price from PnL
-                            # This is approximate
-                            if pnl > 0:
-                                exit_price = take_profit_price
-                            else:
-                                exit_price = stop_loss_price
-                
-                    print(f"   📍 {symbol}: Entry ${entry_price:.4f}, SL ${stop_loss_price:.4f}, TP ${take_profit_price:.4f}")
-                    if exit_time:
-                        exit_price_str = f"${exit_price:.4f}" if exit_price else "N/A"
-                        print(f"   🎯 Exit: {exit_reason} at {exit_price_str}")
-                
-                    self.visualize_trade(
-                        symbol=symbol,
-                        entry_time=entry_time,
-                        entry_price=entry_price,
-                        stop_loss_price=stop_loss_price,
-                        take_profit_price=take_profit_price,
-                        actual_exit_time=exit_time,
-                        actual_exit_price=exit_price,
-                        exit_reason=exit_reason
-                    )
-                
-                except Exception as e:
-                    print(f"❌ Error processing trade {idx + 1}: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Error processing CSV file: {e}")
-            print(f"❌ Error processing CSV file: {e}")
-
-
-def main():
-    """Main function for interactive use"""
-    print("🎯 TRADE VISUALIZER")
-    print("=" * 50)
-    
-    visualizer = TradeVisualizer()
-    
-    print("\nOptions:")
-    print("1. Visualize from CSV results file")
-    print("2. Visualize single trade manually")
-    
-    choice = input("\nSelect option (1 or 2): ").strip()
-    
-    if choice == "1":
-        # Find CSV files
-        csv_files = [f for f in os.listdir('.') if f.endswith('.csv') and 'analysis' in f.lower()]
-        
-        if not csv_files:
-            print("❌ No CSV analysis files found in current directory")
-            return
-            
-        print(f"\nFound CSV files:")
-        for i, file in enumerate(csv_files, 1):
-            print(f"{i}. {file}")
-            
-        try:
-            file_idx = int(input(f"\nSelect CSV file (1-{len(csv_files)}): ")) - 1
-            selected_file = csv_files[file_idx]
-            
-            max_charts = int(input("How many charts to create (default 5): ") or "5")
-            
-            visualizer.visualize_from_csv(selected_file, max_charts)
-            
-        except (ValueError, IndexError):
-            print("❌ Invalid selection")
-            
-    elif choice == "2":
-        # Manual trade entry
-        symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
-        entry_date = input("Enter entry date (YYYY-MM-DD HH:MM): ").strip()
-        entry_price = float(input("Enter entry price: "))
-        stop_loss_price = float(input("Enter stop loss price: "))
-        take_profit_price = float(input("Enter take profit price: "))
-        
-        entry_time = datetime.strptime(entry_date, "%Y-%m-%d %H:%M")
-        
-        visualizer.visualize_trade(
-            symbol=symbol,
-            entry_time=entry_time,
-            entry_price=entry_price,
-            stop_loss_price=stop_loss_price,
-            take_profit_price=take_profit_price
-        )
-    
-    else:
-        print("❌ Invalid option")
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+Trade Visualization Tool
+Creates charts showing trade entries, exits, and price action
+"""
+import os
+import sys
+from pathlib import Path
+import pandas as pd
+import matplotlib
+
+# Render off-screen unless charts should be shown in a GUI window
+_INTERACTIVE = bool(os.environ.get('TRADE_VIZ_INTERACTIVE'))
+if not _INTERACTIVE:
+    matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from matplotlib.patches import Rectangle
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+from binance.client import Client
+from crypto_analyzer import BinanceClient
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Candle interval charted for every trade
+_KLINE_INTERVAL = Client.KLINE_INTERVAL_1HOUR
+
+# Concurrent kline requests when prefetching several symbols
+_PREFETCH_WORKERS = 10
+
+# Compact dtypes for results CSV columns; prices stay float64 for precision
+_CSV_DTYPES = {
+    'Coin': 'category',
+    'Close_Reason': 'category',
+    'Outcome': 'category',
+    'PnL': 'float32',
+    'Risk_Amount': 'float32',
+    'Hours_to_Hit': 'float32',
+}
+
+
+def _read_trades_csv(csv_file: str) -> pd.DataFrame:
+    """Read a results CSV with compact dtypes for the columns it has"""
+    columns = pd.read_csv(csv_file, nrows=0).columns
+    dtypes = {col: dtype for col, dtype in _CSV_DTYPES.items() if col in columns}
+    return pd.read_csv(csv_file, dtype=dtypes)
+
+
+def _to_utc(ts) -> pd.Timestamp:
+    """Timestamp in UTC, treating naive values as UTC like BinanceClient does"""
+    ts = pd.Timestamp(ts)
+    return ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')
+
+
+# Pillow encoder options per output format; JPEG is far cheaper to encode for batch runs
+_SAVE_PIL_KWARGS = {
+    'png': {'compress_level': 1},
+    'jpg': {'quality': 85, 'optimize': False, 'progressive': False}
+}
+
+# Resolution of charts saved by visualize_from_csv; single charts keep visualize_trade's 300 DPI
+_BATCH_DPI = 120
+
+# Chart text, filled with str.format_map per trade
+_TITLE_TEMPLATE = '{symbol} Trade Analysis\nEntry: {entry_time:%Y-%m-%d %H:%M} at ${entry_price:.4f}'
+_LEVEL_LABEL_TEMPLATES = ('Entry: ${:.4f}', 'Stop Loss: ${:.4f}', 'Take Profit: ${:.4f}')
+_FILENAME_TEMPLATE = 'trade_chart_{symbol}_{entry_time:%Y%m%d_%H%M%S}.{ext}'
+
+
+class _TradeChart:
+    """Reusable trade chart figure whose artists are updated for each trade"""
+    
+    def __init__(self, df: pd.DataFrame, entry_time: datetime):
+        fig, ax1 = plt.subplots(1, 1, figsize=(15, 10))
+        
+        # Price chart - df already has timestamp as index
+        self._price_line, = ax1.plot(df.index, df['close'], 'b-', linewidth=1, label='Price', alpha=0.8, rasterized=True)
+        
+        # Entry point, then Entry/Stop Loss/Take Profit levels as one full-width
+        # collection (x in axes coordinates) with proxy lines for the legend
+        self._entry_vline = ax1.axvline(x=entry_time, color='green', linestyle='--', alpha=0.7, label='Entry Time')
+        level_colors = ('green', 'red', 'blue')
+        self._levels = LineCollection([], colors=level_colors, linestyles='-', alpha=0.7,
+                                      transform=ax1.get_yaxis_transform())
+        ax1.add_collection(self._levels, autolim=False)
+        self._level_proxies = [Line2D([], [], color=color, linestyle='-', alpha=0.7) for color in level_colors]
+        
+        # Trade range band between Stop Loss and Take Profit
+        self._range_band = Rectangle((0, 0), 1, 0, transform=ax1.get_yaxis_transform(),
+                                     color='gray', alpha=0.1, label='Trade Range')
+        ax1.add_patch(self._range_band)
+        
+        # Actual exit, hidden for trades without one
+        self._exit_vline = ax1.axvline(x=entry_time, linestyle=':', alpha=0.7)
+        self._exit_scatter = ax1.scatter([], [], s=100, zorder=5)
+        
+        # Formatting
+        ax1.set_ylabel('Price (USDT)', fontweight='bold')
+        ax1.set_xlabel('Time', fontweight='bold')
+        ax1.grid(True, alpha=0.3)
+        
+        # Limits are set directly from each trade's data in render()
+        ax1.set_autoscale_on(False)
+        
+        # Format x-axis (formatter and locator are bound to this axis, created once per chart)
+        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d %H:%M'))
+        ax1.xaxis.set_major_locator(mdates.HourLocator(interval=12))
+        ax1.tick_params(axis='x', rotation=45, labelsize=9)
+        
+        # Fixed margins fit the title and rotated tick labels without a
+        # tight-layout/tight-bbox measuring pass on every save
+        fig.subplots_adjust(left=0.07, right=0.96, top=0.93, bottom=0.12)
+        
+        self._fig, self._ax = fig, ax1
+    
+    def _set_limits(self, df: pd.DataFrame, entry_time: datetime, levels: Tuple[float, ...],
+                    exit_time: Optional[datetime], exit_price: Optional[float]):
+        """Fit the axes to the candles, levels and exit with the default 5% margins"""
+        times = [df.index[0], df.index[-1], entry_time]
+        prices = [np.nanmin(df['close'].to_numpy()), np.nanmax(df['close'].to_numpy()), *levels]
+        if exit_time is not None:
+            times.append(exit_time)
+            prices.append(exit_price)
+        
+        x = [mdates.date2num(t) for t in times]
+        x_lo, x_hi = min(x), max(x)
+        y_lo, y_hi = np.nanmin(prices), np.nanmax(prices)
+        x_pad = (x_hi - x_lo) * 0.05
+        y_pad = (y_hi - y_lo) * 0.05
+        self._ax.set_xlim(x_lo - x_pad, x_hi + x_pad)
+        self._ax.set_ylim(y_lo - y_pad, y_hi + y_pad)
+    
+    def render(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        entry_time: datetime,
+        entry_price: float,
+        stop_loss_price: float,
+        take_profit_price: float,
+        actual_exit_time: datetime = None,
+        actual_exit_price: float = None,
+        exit_reason: str = None,
+        dpi: int = 300,
+        fmt: str = 'png'
+    ) -> str:
+        """Draw one trade on the chart, save it and return the filename"""
+        ax1 = self._ax
+        
+        self._price_line.set_data(df.index, df['close'])
+        self._entry_vline.set_xdata([entry_time, entry_time])
+        levels = (entry_price, stop_loss_price, take_profit_price)
+        self._levels.set_segments([[(0, level), (1, level)] for level in levels])
+        for proxy, template, level in zip(self._level_proxies, _LEVEL_LABEL_TEMPLATES, levels):
+            proxy.set_label(template.format(level))
+        legend_handles = [self._price_line, self._entry_vline, *self._level_proxies]
+        
+        # Actual exit (if provided)
+        has_exit = bool(actual_exit_time and actual_exit_price)
+        self._exit_vline.set_visible(has_exit)
+        self._exit_scatter.set_visible(has_exit)
+        if has_exit:
+            color = 'green' if exit_reason == 'PROFIT' else 'red' if exit_reason == 'LOSS' else 'orange'
+            self._exit_vline.set_xdata([actual_exit_time, actual_exit_time])
+            self._exit_vline.set_color(color)
+            self._exit_vline.set_label(f'Exit Time ({exit_reason})')
+            self._exit_scatter.set_offsets([[mdates.date2num(actual_exit_time), actual_exit_price]])
+            self._exit_scatter.set_color(color)
+            self._exit_scatter.set_label(f'Exit: ${actual_exit_price:.4f}')
+            legend_handles += [self._exit_vline, self._exit_scatter]
+        
+        # Fill areas
+        self._range_band.set_y(stop_loss_price)
+        self._range_band.set_height(take_profit_price - stop_loss_price)
+        legend_handles.append(self._range_band)
+        
+        # Formatting
+        fields = {'symbol': symbol, 'entry_time': entry_time, 'entry_price': entry_price}
+        ax1.set_title(_TITLE_TEMPLATE.format_map(fields), fontsize=14, fontweight='bold')
+        ax1.legend(handles=legend_handles, loc='upper left')
+        self._set_limits(df, entry_time, levels, actual_exit_time if has_exit else None,
+                         actual_exit_price if has_exit else None)
+        
+        # Save chart
+        filename = _FILENAME_TEMPLATE.format_map({**fields, 'ext': fmt})
+        self._fig.savefig(filename, dpi=dpi, format=fmt, pil_kwargs=_SAVE_PIL_KWARGS.get(fmt))
+        return filename
+
+
+def _render_plotly_chart(
+    df: pd.DataFrame,
+    symbol: str,
+    entry_time: datetime,
+    entry_price: float,
+    stop_loss_price: float,
+    take_profit_price: float,
+    actual_exit_time: datetime = None,
+    actual_exit_price: float = None,
+    exit_reason: str = None
+) -> str:
+    """Write an interactive HTML chart of one trade and return the filename"""
+    import plotly.graph_objects as go
+    
+    # plotly-resampler re-aggregates the price trace on zoom when available
+    try:
+        from plotly_resampler import FigureResampler
+        fig = FigureResampler(go.Figure())
+        fig.add_trace(go.Scattergl(name='Price', line=dict(color='blue', width=1)), hf_x=df.index, hf_y=df['close'])
+    except ImportError:
+        fig = go.Figure()
+        fig.add_trace(go.Scattergl(x=df.index, y=df['close'], name='Price', line=dict(color='blue', width=1)))
+    
+    # Entry point, Stop Loss and Take Profit levels
+    fig.add_vline(x=entry_time, line=dict(color='green', dash='dash'), opacity=0.7)
+    levels = (entry_price, stop_loss_price, take_profit_price)
+    for level, color, template in zip(levels, ('green', 'red', 'blue'), _LEVEL_LABEL_TEMPLATES):
+        fig.add_hline(y=level, line=dict(color=color), opacity=0.7, annotation_text=template.format(level))
+    fig.add_hrect(y0=stop_loss_price, y1=take_profit_price, fillcolor='gray', opacity=0.1, line_width=0)
+    
+    # Actual exit (if provided)
+    if actual_exit_time and actual_exit_price:
+        color = 'green' if exit_reason == 'PROFIT' else 'red' if exit_reason == 'LOSS' else 'orange'
+        fig.add_vline(x=actual_exit_time, line=dict(color=color, dash='dot'), opacity=0.7)
+        fig.add_trace(go.Scatter(x=[actual_exit_time], y=[actual_exit_price], mode='markers',
+                                 marker=dict(color=color, size=12), name=f'Exit ({exit_reason}): ${actual_exit_price:.4f}'))
+    
+    fields = {'symbol': symbol, 'entry_time': entry_time, 'entry_price': entry_price}
+    fig.update_layout(
+        title=_TITLE_TEMPLATE.format_map(fields).replace('\n', '<br>'),
+        xaxis_title='Time',
+        yaxis_title='Price (USDT)'
+    )
+    
+    filename = _FILENAME_TEMPLATE.format_map({**fields, 'ext': 'html'})
+    fig.write_html(filename, include_plotlyjs='cdn')
+    return filename
+
+
+# Chart reused by every render in this process (one per worker process)
+_chart: Optional[_TradeChart] = None
+
+
+def _render_chart(task: Dict) -> str:
+    """Render one trade chart from a task of prefetched candles and trade fields"""
+    global _chart
+    if _chart is None:
+        _chart = _TradeChart(task['df'], task['entry_time'])
+    return _chart.render(**task)
+
+
+def _render_chart_task(task: Dict) -> Tuple[Optional[str], Optional[str]]:
+    """Process-pool entry point returning (filename, error)"""
+    try:
+        return _render_chart(task), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _close_chart():
+    """Free this process's reusable chart once a batch is done"""
+    global _chart
+    if _chart is not None:
+        plt.close(_chart._fig)
+        _chart = None
+
+
+def _init_render_worker():
+    """Render off-screen in worker processes"""
+    plt.switch_backend('Agg')
+
+
+def _detect_schema(cols: frozenset) -> Optional[str]:
+    """Name the results CSV format from its columns, or None if unsupported"""
+    if {'Signal_Date', 'Signal_Time'} <= cols:
+        return 'concurrent'
+    if {'Date', 'Time'} <= cols:
+        return 'regular'
+    return None
+
+
+def _extract_concurrent_trades(df: pd.DataFrame, cols: frozenset):
+    """Entry times/prices and exit times/reasons from a concurrent portfolio CSV"""
+    entry_times = pd.to_datetime(df['Signal_Date'].astype(str) + ' ' + df['Signal_Time'].astype(str), errors='coerce', format='mixed')
+    entry_prices = df['Entry_Fill_Price'] if 'Entry_Fill_Price' in cols else df['Limit_Price']
+    
+    # Extract exit information
+    exit_times = pd.to_datetime(df['Close_Time'], errors='coerce', format='mixed') if 'Close_Time' in cols else pd.NaT
+    exit_reasons = df['Close_Reason'] if 'Close_Reason' in cols else 'UNKNOWN'
+    return entry_times, entry_prices, exit_times, exit_reasons
+
+
+def _extract_regular_trades(df: pd.DataFrame, cols: frozenset):
+    """Entry times/prices and exit times/reasons from a regular portfolio CSV"""
+    entry_times = pd.to_datetime(df['Date'].astype(str) + ' ' + df['Time'].astype(str), errors='coerce', format='mixed')
+    entry_prices = df['Entry_Price']
+    
+    # Determine exit info if available
+    exit_reasons = df['Outcome'] if 'Outcome' in cols else 'UNKNOWN'
+    if 'Hours_to_Hit' in cols:
+        exit_times = entry_times + pd.to_timedelta(pd.to_numeric(df['Hours_to_Hit'], errors='coerce'), unit='h')
+    else:
+        exit_times = pd.NaT
+    return entry_times, entry_prices, exit_times, exit_reasons
+
+
+_TRADE_EXTRACTORS = {
+    'concurrent': _extract_concurrent_trades,
+    'regular': _extract_regular_trades
+}
+
+
+class TradeVisualizer:
+    """Visualize individual trades with price action"""
+    
+    def __init__(self):
+        self.client = BinanceClient()
+        
+        # Hourly candles per symbol and the [start, end) windows already fetched
+        self._price_cache = {}
+        self._fetched_ranges = {}
+    
+    def _get_price_data(self, symbol: str, start_time: datetime, hours: int):
+        """Get hourly candles from start_time, reusing earlier fetches that cover the window"""
+        start = _to_utc(start_time)
+        end = start + timedelta(hours=hours)
+        
+        for fetched_start, fetched_end in self._fetched_ranges.get(symbol, ()):
+            if fetched_start <= start and end <= fetched_end:
+                cached = self._price_cache[symbol]
+                first, last = cached.index.searchsorted([start, end])
+                return cached.iloc[first:last]
+        
+        # Page through windows longer than one request allows
+        pages = []
+        page_start, remaining = start_time, hours
+        while remaining > 0:
+            limit = min(remaining, 1000)  # Binance API limit
+            page = self.client.get_klines_for_timeframe(
+                symbol=symbol,
+                start_dt=page_start,
+                interval=_KLINE_INTERVAL,
+                limit=limit
+            )
+            if page is None or len(page) == 0:
+                break
+            pages.append(page)
+            if len(page) < limit:
+                break
+            page_start = page.index[-1] + timedelta(hours=1)
+            remaining -= len(page)
+        
+        if not pages:
+            return None
+        df = pages[0] if len(pages) == 1 else pd.concat(pages)
+        
+        cached = self._price_cache.get(symbol)
+        if cached is not None:
+            df_all = pd.concat([cached, df])
+            df_all = df_all[~df_all.index.duplicated(keep='last')].sort_index()
+        else:
+            df_all = df
+        self._price_cache[symbol] = df_all
+        self._fetched_ranges.setdefault(symbol, []).append((start, end))
+        
+        return df
+    
+    def _get_trade_price_data(self, symbol: str, entry_time: datetime,
+                              days_before: int = 2, days_after: int = 5):
+        """Get the hourly candles charted around one trade"""
+        # Calculate time range
+        start_time = entry_time - timedelta(days=days_before)
+        end_time = entry_time + timedelta(days=days_after)
+        
+        # Get price data using the correct method
+        print(f"📊 Getting price data for {symbol}...")
+        
+        # Calculate how many hours of data we need
+        total_hours = int((end_time - start_time).total_seconds() / 3600) + 24
+        
+        # Served from the prefetched candles when they cover this window
+        return self._get_price_data(symbol, start_time, total_hours)
+    
+    def _render_charts(self, tasks: List[Dict]):
+        """Render prepared trade charts, in parallel worker processes when there are several"""
+        results = None
+        if len(tasks) > 1:
+            workers = min(len(tasks), os.cpu_count() or 1)
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as executor:
+                    results = list(executor.map(_render_chart_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Process pool unavailable, rendering charts serially: {e}")
+        
+        if results is None:
+            results = [_render_chart_task(task) for task in tasks]
+            _close_chart()
+        
+        for task, (filename, error) in zip(tasks, results):
+            if filename:
+                print(f"✅ Chart saved as: {filename}")
+            else:
+                logger.error(f"Error creating chart for {task['symbol']}: {error}")
+                print(f"❌ Error creating chart for {task['symbol']}: {error}")
+    
+    def _prefetch_price_data(self, symbols: pd.Series, entry_times: pd.Series,
+                             days_before: int = 2, days_after: int = 5):
+        """Fetch one candle range per symbol covering all of its trades, symbols in parallel"""
+        trades = pd.DataFrame({'symbol': symbols, 'entry_time': entry_times}).dropna()
+        
+        windows = []
+        for symbol, symbol_entries in trades.groupby('symbol', sort=False)['entry_time']:
+            start_time = symbol_entries.min() - timedelta(days=days_before)
+            end_time = symbol_entries.max() + timedelta(days=days_after)
+            total_hours = int((end_time - start_time).total_seconds() / 3600) + 24
+            
+            print(f"📊 Prefetching price data for {symbol}...")
+            windows.append((symbol, start_time, total_hours))
+        
+        if not windows:
+            return
+        
+        # Requests are latency-bound and each symbol fills its own cache entry
+        with ThreadPoolExecutor(max_workers=min(_PREFETCH_WORKERS, len(windows))) as executor:
+            futures = [executor.submit(self._get_price_data, *window) for window in windows]
+            for (symbol, _, _), future in zip(windows, futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning(f"Prefetch failed for {symbol}: {e}")
+        
+    def visualize_trade(
+        self, 
+        symbol: str, 
+        entry_time: datetime, 
+        entry_price: float,
+        stop_loss_price: float,
+        take_profit_price: float,
+        actual_exit_time: datetime = None,
+        actual_exit_price: float = None,
+        exit_reason: str = None,
+        days_before: int = 2,
+        days_after: int = 5,
+        show: bool = True,
+        dpi: int = 300,
+        backend: str = 'matplotlib',
+        fmt: str = 'png'
+    ):
+        """
+        Create a chart showing the trade with entry, SL, TP, and actual exit
+        
+        Args:
+            symbol: Trading symbol (e.g., 'BTCUSDT')
+            entry_time: When the trade was entered
+            entry_price: Entry price
+            stop_loss_price: Stop loss price
+            take_profit_price: Take profit price
+            actual_exit_time: When trade actually exited (if known)
+            actual_exit_price: Actual exit price (if known)
+            exit_reason: Reason for exit ('PROFIT', 'LOSS', 'BREAKEVEN', etc.)
+            days_before: Days of price history before entry
+            days_after: Days of price history after entry
+            show: Display the chart after saving it (needs TRADE_VIZ_INTERACTIVE set)
+            dpi: Resolution of the saved chart
+            backend: 'matplotlib' for an image, or 'plotly' for an interactive HTML chart
+                (needs plotly from requirements_advanced.txt)
+            fmt: Image format for the matplotlib backend ('png' or 'jpg')
+        """
+        try:
+            df = self._get_trade_price_data(symbol, entry_time, days_before, days_after)
+            
+            if df is None or len(df) == 0:
+                print(f"❌ No price data found for {symbol}")
+                return
+            
+            if backend == 'plotly':
+                filename = _render_plotly_chart(
+                    df, symbol, entry_time, entry_price, stop_loss_price, take_profit_price,
+                    actual_exit_time, actual_exit_price, exit_reason
+                )
+                print(f"✅ Interactive chart saved as: {filename}")
+                return
+                
+            filename = _render_chart({
+                'df': df,
+                'symbol': symbol,
+                'entry_time': entry_time,
+                'entry_price': entry_price,
+                'stop_loss_price': stop_loss_price,
+                'take_profit_price': take_profit_price,
+                'actual_exit_time': actual_exit_time,
+                'actual_exit_price': actual_exit_price,
+                'exit_reason': exit_reason,
+                'dpi': dpi,
+                'fmt': fmt
+            })
+            print(f"✅ Chart saved as: {filename}")
+            
+            # Show chart
+            if show and _INTERACTIVE:
+                plt.show()
+            
+        except Exception as e:
+            logger.error(f"Error creating chart for {symbol}: {e}")
+            
+    def visualize_from_csv(self, csv_file: str, max_charts: int = 10, fmt: str = 'jpg'):
+        """
+        Create charts for trades from a CSV results file
+        
+        Args:
+            csv_file: Path to CSV file with trade results
+            max_charts: Maximum number of charts to create
+            fmt: Image format for the charts ('jpg' or 'png')
+        """
+        try:
+            df = _read_trades_csv(csv_file)
+            print(f"📊 Found {len(df)} trades in {csv_file}")
+            
+            # Check column names to handle different CSV formats
+            print(f"📋 Columns found: {list(df.columns)}")
+            
+            if max_charts < len(df):
+                print(f"📈 Creating charts for first {max_charts} trades...")
+                df = df.head(max_charts)
+            
+            # Extract trade fields column-wise for the detected CSV format
+            cols = frozenset(df.columns)
+            schema = _detect_schema(cols)
+            if schema is None:
+                print(f"❌ Unsupported CSV format. Expected columns: Signal_Date/Date, Signal_Time/Time, Coin, etc.")
+                return
+            entry_times, entry_prices, exit_times, exit_reasons = _TRADE_EXTRACTORS[schema](df, cols)
+            
+            coins = df['Coin'].astype(object)
+            trades = pd.DataFrame({
+                'symbol': coins.where(coins.str.endswith('USDT', na=False), coins + 'USDT'),
+                'entry_time': entry_times,
+                'entry_price': pd.to_numeric(entry_prices, errors='coerce'),
+                'exit_time': exit_times,
+                'exit_reason': exit_reasons,
+                'pnl': pd.to_numeric(df['PnL'], errors='coerce').fillna(0) if 'PnL' in cols else 0.0
+            }, index=df.index)
+            
+            # Calculate SL and TP from the default assumptions (10% SL, 1.5 R:R),
+            # which also apply when the CSV carries a Risk_Amount
+            stop_loss_pct = 10
+            risk_reward = 1.5
+            trades['stop_loss_price'] = trades['entry_price'] * (1 - stop_loss_pct / 100)
+            trades['take_profit_price'] = trades['entry_price'] * (1 + (stop_loss_pct * risk_reward) / 100)
+            
+            # Determine exit price if not available, only for trades with an exit
+            # time and reason; the PnL sign is an approximate fallback
+            reasons = trades['exit_reason'].astype(object)
+            has_exit = (trades['exit_time'].notna() & reasons.notna() & reasons.ne('')).to_numpy()
+            trades['exit_price'] = np.select(
+                [
+                    has_exit & reasons.isin(['PROFIT', 'WIN']).to_numpy(),
+                    has_exit & reasons.isin(['LOSS', 'STOP']).to_numpy(),
+                    has_exit & reasons.eq('BREAKEVEN').to_numpy(),
+                    has_exit & (trades['pnl'] > 0).to_numpy(),
+                    has_exit & (trades['pnl'] < 0).to_numpy()
+                ],
+                [
+                    trades['take_profit_price'], trades['stop_loss_price'], trades['entry_price'],
+                    trades['take_profit_price'], trades['stop_loss_price']
+                ],
+                default=None
+            )
+            
+            # Fetch each symbol's price history once for all of its trades
+            self._prefetch_price_data(trades['symbol'], trades['entry_time'])
+            
+            tasks = []
+            for n, trade in enumerate(trades.itertuples(index=False), 1):
+                print(f"\n🎯 Preparing chart {n}/{len(trades)}...")
+                
+                try:
+                    symbol = trade.symbol
+                    entry_time = trade.entry_time
+                    entry_price = trade.entry_price
+                    exit_time = trade.exit_time if pd.notna(trade.exit_time) else None
+                    exit_reason = trade.exit_reason
+                    stop_loss_price = trade.stop_loss_price
+                    take_profit_price = trade.take_profit_price
+                    exit_price = trade.exit_price
+                    
+                    if pd.isna(symbol) or pd.isna(entry_time):
+                        raise ValueError("missing coin or entry time")
+                    
+                    print(f"   📍 {symbol}: Entry ${entry_price:.4f}, SL ${stop_loss_price:.4f}, TP ${take_profit_price:.4f}")
+                    if exit_time:
+                        exit_price_str = f"${exit_price:.4f}" if exit_price else "N/A"
+                        print(f"   🎯 Exit: {exit_reason} at {exit_price_str}")
+                
+                    df_trade = self._get_trade_price_data(symbol, entry_time)
+                    if df_trade is None or len(df_trade) == 0:
+                        print(f"❌ No price data found for {symbol}")
+                        continue
+                    
+                    tasks.append({
+                        'df': df_trade,
+                        'symbol': symbol,
+                        'entry_time': entry_time,
+                        'entry_price': entry_price,
+                        'stop_loss_price': stop_loss_price,
+                        'take_profit_price': take_profit_price,
+                        'actual_exit_time': exit_time,
+                        'actual_exit_price': exit_price,
+                        'exit_reason': exit_reason,
+                        'dpi': _BATCH_DPI,
+                        'fmt': fmt
+                    })
+                
+                except Exception as e:
+                    print(f"❌ Error processing trade {n}: {e}")
+                    continue
+            
+            self._render_charts(tasks)
+                    
+        except Exception as e:
+            logger.error(f"Error processing CSV file: {e}")
+            print(f"❌ Error processing CSV file: {e}")
+
+
+def main():
+    """Main function for interactive use"""
+    print("🎯 TRADE VISUALIZER")
+    print("=" * 50)
+    
+    visualizer = TradeVisualizer()
+    
+    print("\nOptions:")
+    print("1. Visualize from CSV results file")
+    print("2. Visualize single trade manually")
+    
+    choice = input("\nSelect option (1 or 2): ").strip()
+    
+    if choice == "1":
+        # Find CSV files
+        csv_files = [f for f in os.listdir('.') if f.endswith('.csv') and 'analysis' in f.lower()]
+        
+        if not csv_files:
+            print("❌ No CSV analysis files found in current directory")
+            return
+            
+        print(f"\nFound CSV files:")
+        for i, file in enumerate(csv_files, 1):
+            print(f"{i}. {file}")
+            
+        try:
+            file_idx = int(input(f"\nSelect CSV file (1-{len(csv_files)}): ")) - 1
+            selected_file = csv_files[file_idx]
+            
+            max_charts = int(input("How many charts to create (default 5): ") or "5")
+            
+            visualizer.visualize_from_csv(selected_file, max_charts)
+            
+        except (ValueError, IndexError):
+            print("❌ Invalid selection")
+            
+    elif choice == "2":
+        # Manual trade entry
+        symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
+        entry_date = input("Enter entry date (YYYY-MM-DD HH:MM): ").strip()
+        entry_price = float(input("Enter entry price: "))
+        stop_loss_price = float(input("Enter stop loss price: "))
+        take_profit_price = float(input("Enter take profit price: "))
+        
+        interactive = input("Create interactive HTML chart instead of PNG? (y/N): ").strip().lower() == 'y'
+        
+        entry_time = datetime.strptime(entry_date, "%Y-%m-%d %H:%M")
+        
+        visualizer.visualize_trade(
+            symbol=symbol,
+            entry_time=entry_time,
+            entry_price=entry_price,
+            stop_loss_price=stop_loss_price,
+            take_profit_price=take_profit_price,
+            backend='plotly' if interactive else 'matplotlib'
+        )
+    
+    else:
+        print("❌ Invalid option")
+
+
+if __name__ == "__main__":
+    main()
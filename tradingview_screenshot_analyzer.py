@@ -7,11 +7,14 @@ Adjusts timeframe based on how long it took to hit TP or SL
 import sys
 from pathlib import Path
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import os
 import json
 import time
 import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -19,6 +22,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Tuple, Optional
 
 # Add src to path for imports
@@ -30,10 +35,56 @@ try:
 except ImportError:
     pass
 
+# orjson parses kline responses and writes results several times faster when installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 from crypto_analyzer import TradingSignal
 
 logger = logging.getLogger(__name__)
 
+# Concurrent Binance kline requests when prefetching signal windows
+_KLINES_WORKERS = 8
+
+# Kline fields used by the analysis: open time, high, low and close (indices 0, 2, 3, 4)
+_KLINE_COLUMNS = ['timestamp', 'high', 'low', 'close']
+_KLINE_DTYPE = np.dtype([('timestamp', 'i8'), ('high', 'f8'), ('low', 'f8'), ('close', 'f8')])
+
+# Signals CSV columns read by process_signals_file ('price' is an entry price alias)
+_SIGNAL_COLUMNS = {'timestamp', 'symbol', 'entry_price', 'price'}
+
+# Chart timeframe by trade duration: up to 1 hour, 4 hours, 1 day, 3 days, then longer
+_DURATION_BOUNDS = np.array([60, 240, 1440, 4320])
+_TIMEFRAMES = ('5', '15', '60', '240', '1D')
+
+# Binance request weight per minute above which requests wait for the next minute (limit 1200)
+_WEIGHT_THRESHOLD = 1100
+
+# 1-minute candles per Binance klines request, which bounds each signal's analysis
+_KLINES_LIMIT = 1000
+
+# Signals with less price history than this are reported as ongoing without fetching klines
+_MIN_ANALYSIS_WINDOW = timedelta(minutes=5)
+
+# Headless Chrome instances capturing screenshots in parallel
+_SCREENSHOT_WORKERS = 4
+
+# Seconds to wait for an in-page symbol switch to load its data before reloading the chart
+_CHART_SWITCH_TIMEOUT = 30
+
+def _utc_now() -> pd.Timestamp:
+    """Current time as a naive UTC timestamp, the clock Binance candle times are in"""
+    return pd.Timestamp.now('UTC').tz_localize(None)
+
+def _klines_span(start_time: datetime, end_time: datetime) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    """Candles one klines request returns for a window: at most _KLINES_LIMIT from the first whole minute"""
+    start = pd.Timestamp(start_time)
+    return start, min(pd.Timestamp(end_time), start.ceil('min') + timedelta(minutes=_KLINES_LIMIT - 1))
+
 class TradingViewScreenshotAnalyzer:
     """Automated TradingView screenshot capture with dynamic timeframes"""
     
@@ -41,9 +92,24 @@ class TradingViewScreenshotAnalyzer:
         self.binance_api_key = binance_api_key or os.getenv('BINANCE_API_KEY')
         self.binance_secret = binance_secret or os.getenv('BINANCE_SECRET')
         self.driver = None
+        self._session = self._create_session()
+        self._klines_cache: Dict[Tuple[str, int], pd.DataFrame] = {}
+        self._klines_cache_dir = Path("klines_cache")
+        self._last_weight = 0
         self.screenshots_dir = "tradingview_screenshots"
         self.setup_directories()
         
+    def _create_session(self) -> requests.Session:
+        """HTTP session keeping Binance connections alive across the prefetch workers"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        session.mount('https://', adapter)
+        return session
+    
     def setup_directories(self):
         """Create necessary directories"""
         os.makedirs(self.screenshots_dir, exist_ok=True)
@@ -51,6 +117,11 @@ class TradingViewScreenshotAnalyzer:
         
     def setup_webdriver(self):
         """Setup Chrome WebDriver for TradingView"""
+        self.driver = self._create_webdriver()
+        return self.driver is not None
+    
+    def _create_webdriver(self):
+        """Start a headless Chrome WebDriver, or return None if it cannot start"""
         chrome_options = Options()
         chrome_options.add_argument("--headless")  # Run headless Chrome
         chrome_options.add_argument("--no-sandbox")
@@ -60,53 +131,168 @@ class TradingViewScreenshotAnalyzer:
         chrome_options.add_argument("--disable-gpu")
         
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
+            driver = webdriver.Chrome(options=chrome_options)
             print("✅ Chrome WebDriver initialized successfully")
         except Exception as e:
             print(f"❌ Error initializing WebDriver: {e}")
             print("Please install ChromeDriver: brew install chromedriver")
-            return False
-        return True
+            return None
+        return driver
     
     def get_historical_data(self, symbol: str, start_time: datetime, end_time: datetime) -> pd.DataFrame:
+        """Get historical price data, served from the prefetched klines when available"""
+        key = (symbol, int(start_time.timestamp() * 1000))
+        if key not in self._klines_cache:
+            self._klines_cache[key] = self._fetch_historical_data(symbol, start_time, end_time)
+        return self._klines_cache[key]
+    
+    def _fetch_historical_data(self, symbol: str, start_time: datetime, end_time: datetime) -> pd.DataFrame:
         """Get historical price data from Binance API"""
         try:
             base_url = "https://api.binance.com/api/v3/klines"
             
-            # Convert to milliseconds
-            start_ms = int(start_time.timestamp() * 1000)
-            end_ms = int(end_time.timestamp() * 1000)
+            # Convert to milliseconds, reading naive times as UTC like the returned candles
+            start_ms = int(pd.Timestamp(start_time).timestamp() * 1000)
+            end_ms = int(pd.Timestamp(end_time).timestamp() * 1000)
             
             params = {
                 'symbol': symbol,
                 'interval': '1m',  # 1-minute intervals for precise analysis
                 'startTime': start_ms,
                 'endTime': end_ms,
-                'limit': 1000
+                'limit': _KLINES_LIMIT
             }
             
-            response = requests.get(base_url, params=params)
+            response = self._session.get(base_url, params=params, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            # Only pause when the used request weight nears Binance's per-minute limit
+            self._last_weight = int(response.headers.get('X-MBX-USED-WEIGHT-1M', 0))
+            if self._last_weight > _WEIGHT_THRESHOLD:
+                time.sleep(60 - time.time() % 60)
             
-            # Convert to DataFrame
-            df = pd.DataFrame(data, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_asset_volume', 'number_of_trades',
-                'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-            ])
+            data = _json_loads(response.content)
+            if not data:
+                return pd.DataFrame(columns=_KLINE_COLUMNS)
+            
+            # Convert to DataFrame via one typed array holding only the used fields
+            candles = np.fromiter(
+                ((row[0], row[2], row[3], row[4]) for row in data),
+                dtype=_KLINE_DTYPE,
+                count=len(data)
+            )
+            df = pd.DataFrame({
+                'timestamp': pd.to_datetime(candles['timestamp'], unit='ms'),
+                'high': candles['high'],
+                'low': candles['low'],
+                'close': candles['close']
+            })
             
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = df[col].astype(float)
-                
             return df
             
         except Exception as e:
             print(f"❌ Error getting historical data for {symbol}: {e}")
             return pd.DataFrame()
     
+    def _analysis_window(self, signal: TradingSignal) -> Tuple[datetime, datetime]:
+        """Price data window analysed for a signal (up to 30 days)"""
+        end_time = signal.timestamp + timedelta(days=30)
+        now = _utc_now()
+        if end_time > now:
+            end_time = now
+        return signal.timestamp, end_time
+    
+    def _fetch_symbol_range(self, symbol: str, start_time: datetime, end_time: datetime) -> pd.DataFrame:
+        """Get 1-minute candles for a whole range, reading closed UTC days from the disk cache"""
+        start, end = pd.Timestamp(start_time), pd.Timestamp(end_time)
+        today = _utc_now().floor('D')
+        symbol_dir = self._klines_cache_dir / symbol
+        
+        frames = []
+        missing_runs = []
+        for day in pd.date_range(start.floor('D'), end.floor('D'), freq='D'):
+            day_file = symbol_dir / f"{day:%Y-%m-%d}.pkl"
+            if day < today and day_file.exists():
+                frames.append(pd.read_pickle(day_file))
+            elif missing_runs and missing_runs[-1][1] == day - timedelta(days=1):
+                missing_runs[-1][1] = day
+            else:
+                missing_runs.append([day, day])
+        
+        # Fetch missing days whole so every closed day can be cached
+        for first_day, last_day in missing_runs:
+            candles = self._fetch_candles(symbol, first_day, last_day + timedelta(days=1, minutes=-1))
+            if candles.empty:
+                continue
+            frames.append(candles)
+            
+            last_candle = candles['timestamp'].iloc[-1]
+            for day, day_candles in candles.groupby(candles['timestamp'].dt.floor('D')):
+                if day < today and last_candle >= day + timedelta(days=1, minutes=-1):
+                    symbol_dir.mkdir(parents=True, exist_ok=True)
+                    day_candles.reset_index(drop=True).to_pickle(symbol_dir / f"{day:%Y-%m-%d}.pkl")
+        
+        if not frames:
+            return pd.DataFrame()
+        candles = pd.concat(frames, ignore_index=True).sort_values('timestamp', ignore_index=True)
+        return candles[(candles['timestamp'] >= start) & (candles['timestamp'] <= end)].reset_index(drop=True)
+    
+    def _fetch_candles(self, symbol: str, start_time: datetime, end_time: datetime) -> pd.DataFrame:
+        """Get 1-minute candles from Binance for a whole range, paging past the per-request limit"""
+        pages = []
+        page_start = pd.Timestamp(start_time)
+        while page_start <= end_time:
+            page = self._fetch_historical_data(symbol, page_start, end_time)
+            if page.empty:
+                break
+            pages.append(page)
+            if len(page) < _KLINES_LIMIT:
+                break
+            page_start = page['timestamp'].iloc[-1] + timedelta(minutes=1)
+        return pd.concat(pages, ignore_index=True) if pages else pd.DataFrame()
+    
+    def _prefetch_symbol_klines(self, symbol: str, windows: Dict[Tuple[str, int], Tuple[datetime, datetime]]) -> Dict:
+        """Fetch one symbol's signal windows as merged ranges and slice out each signal's candles"""
+        try:
+            # Each signal analyses at most one request's worth of candles from its start
+            spans = {key: _klines_span(start, end) for key, (start, end) in windows.items()}
+            merged = []
+            for start, end in sorted(spans.values()):
+                if merged and start <= merged[-1][1] + timedelta(minutes=1):
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            
+            candles = pd.concat([self._fetch_symbol_range(symbol, start, end) for start, end in merged], ignore_index=True)
+            if candles.empty:
+                return {key: candles for key in windows}
+            
+            frames = {}
+            timestamps = candles['timestamp']
+            for key, (start, end) in spans.items():
+                frames[key] = candles[(timestamps >= start) & (timestamps <= end)].reset_index(drop=True)
+            return frames
+        
+        except Exception as e:
+            logger.warning(f"Prefetch failed for {symbol}: {e}")
+            return {}
+    
+    def _prefetch_klines(self, signals: List[TradingSignal]):
+        """Fetch price data for all signals once per symbol, symbols concurrently"""
+        windows_by_symbol = {}
+        for signal in signals:
+            start_time, end_time = self._analysis_window(signal)
+            key = (signal.symbol, int(start_time.timestamp() * 1000))
+            if end_time - start_time >= _MIN_ANALYSIS_WINDOW and key not in self._klines_cache:
+                windows_by_symbol.setdefault(signal.symbol, {})[key] = (start_time, end_time)
+        if not windows_by_symbol:
+            return
+        
+        print(f"📥 Prefetching price data for {len(windows_by_symbol)} symbols...")
+        with ThreadPoolExecutor(max_workers=min(_KLINES_WORKERS, len(windows_by_symbol))) as executor:
+            for frames in executor.map(self._prefetch_symbol_klines, windows_by_symbol.keys(), windows_by_symbol.values()):
+                self._klines_cache.update(frames)
+    
     def analyze_trade_outcome(self, signal: TradingSignal, stop_loss_pct: float = 10.0, 
                             risk_reward_ratio: float = 1.5) -> Dict:
         """Analyze when a trade hit SL or TP and determine optimal timeframe"""
@@ -116,11 +302,19 @@ class TradingViewScreenshotAnalyzer:
         take_profit_price = entry_price * (1 + (stop_loss_pct * risk_reward_ratio) / 100)
         
         # Get historical data for analysis (up to 30 days)
-        end_time = signal.timestamp + timedelta(days=30)
-        if end_time > datetime.now():
-            end_time = datetime.now()
-            
-        df = self.get_historical_data(signal.symbol, signal.timestamp, end_time)
+        start_time, end_time = self._analysis_window(signal)
+        if end_time - start_time < _MIN_ANALYSIS_WINDOW:
+            return {
+                'outcome': 'ongoing',
+                'hit_time': None,
+                'duration_minutes': 0,
+                'recommended_timeframe': '5',
+                'final_price': entry_price,
+                'max_profit_pct': 0,
+                'max_loss_pct': 0
+            }
+        
+        df = self.get_historical_data(signal.symbol, start_time, end_time)
         
         if df.empty:
             return {
@@ -133,22 +327,15 @@ class TradingViewScreenshotAnalyzer:
                 'max_loss_pct': 0
             }
         
-        # Find when SL or TP was hit
-        hit_sl_time = None
-        hit_tp_time = None
+        lows = df['low'].to_numpy()
+        highs = df['high'].to_numpy()
+        closes = df['close'].to_numpy()
         
-        for _, row in df.iterrows():
-            current_time = row['timestamp']
-            low_price = row['low']
-            high_price = row['high']
-            
-            # Check if stop loss was hit
-            if low_price <= stop_loss_price and hit_sl_time is None:
-                hit_sl_time = current_time
-                
-            # Check if take profit was hit
-            if high_price >= take_profit_price and hit_tp_time is None:
-                hit_tp_time = current_time
+        # Find when SL or TP was first hit
+        sl_mask = lows <= stop_loss_price
+        tp_mask = highs >= take_profit_price
+        hit_sl_time = df['timestamp'].iloc[sl_mask.argmax()] if sl_mask.any() else None
+        hit_tp_time = df['timestamp'].iloc[tp_mask.argmax()] if tp_mask.any() else None
         
         # Determine outcome and timing
         outcome = 'ongoing'
@@ -176,24 +363,15 @@ class TradingViewScreenshotAnalyzer:
             duration_minutes = (df['timestamp'].iloc[-1] - signal.timestamp).total_seconds() / 60
         
         # Determine optimal timeframe based on duration
-        if duration_minutes <= 60:  # Less than 1 hour
-            timeframe = '5'
-        elif duration_minutes <= 240:  # Less than 4 hours
-            timeframe = '15'
-        elif duration_minutes <= 1440:  # Less than 1 day
-            timeframe = '60'
-        elif duration_minutes <= 4320:  # Less than 3 days
-            timeframe = '240'
-        else:
-            timeframe = '1D'
+        timeframe = _TIMEFRAMES[np.searchsorted(_DURATION_BOUNDS, duration_minutes)]
         
         # Calculate max profit/loss percentages
-        max_price = df['high'].max()
-        min_price = df['low'].min()
+        max_price = highs.max()
+        min_price = lows.min()
         max_profit_pct = ((max_price - entry_price) / entry_price) * 100
         max_loss_pct = ((min_price - entry_price) / entry_price) * 100
         
-        final_price = df['close'].iloc[-1] if not df.empty else entry_price
+        final_price = closes[-1]
         
         return {
             'outcome': outcome,
@@ -208,36 +386,33 @@ class TradingViewScreenshotAnalyzer:
         }
     
     def capture_tradingview_screenshot(self, signal: TradingSignal, analysis: Dict, 
-                                     filename: str) -> bool:
-        """Capture TradingView screenshot with annotations"""
+                                     filename: str, driver=None) -> bool:
+        """Capture TradingView screenshot with annotations, using self.driver unless a driver is given"""
+        driver = driver or self.driver
         try:
             symbol_clean = signal.symbol.replace('USDT', '')
-            
-            # Build TradingView URL
-            tv_url = f"https://www.tradingview.com/chart/?symbol=BINANCE:{symbol_clean}USDT"
-            
-            # Add timeframe parameter
+            tv_symbol = f"BINANCE:{symbol_clean}USDT"
             timeframe = analysis['recommended_timeframe']
-            tv_url += f"&interval={timeframe}"
             
             print(f"📸 Capturing screenshot for {signal.symbol} with {timeframe} timeframe...")
             
-            # Navigate to TradingView
-            self.driver.get(tv_url)
+            # Switch the already loaded chart, navigating to TradingView only the first time
+            if not self._switch_chart(driver, tv_symbol, timeframe):
+                driver.get(f"https://www.tradingview.com/chart/?symbol={tv_symbol}&interval={timeframe}")
             
             # Wait for chart to load
             try:
-                WebDriverWait(self.driver, 30).until(
+                WebDriverWait(driver, 30).until(
                     EC.presence_of_element_located((By.CLASS_NAME, "chart-container"))
                 )
-                time.sleep(5)  # Additional wait for chart data
+                self._wait_for_chart_idle(driver)  # Additional wait for chart data
             except TimeoutException:
                 print(f"❌ Timeout waiting for chart to load for {signal.symbol}")
                 return False
             
             # Try to close any popups/notifications
             try:
-                close_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@class, 'close') or contains(text(), 'Close') or contains(@aria-label, 'Close')]")
+                close_buttons = driver.find_elements(By.XPATH, "//button[contains(@class, 'close') or contains(text(), 'Close') or contains(@aria-label, 'Close')]")
                 for button in close_buttons:
                     try:
                         button.click()
@@ -257,7 +432,7 @@ class TradingViewScreenshotAnalyzer:
             
             # Take screenshot
             screenshot_path = os.path.join(self.screenshots_dir, "signals", filename)
-            self.driver.save_screenshot(screenshot_path)
+            driver.save_screenshot(screenshot_path)
             
             print(f"✅ Screenshot saved: {screenshot_path}")
             return True
@@ -266,6 +441,42 @@ class TradingViewScreenshotAnalyzer:
             print(f"❌ Error capturing screenshot for {signal.symbol}: {e}")
             return False
     
+    def _switch_chart(self, driver, tv_symbol: str, timeframe: str) -> bool:
+        """Change symbol and interval of a loaded chart in-page and wait for the new data
+        
+        Returns False if no chart is loaded yet or the switch does not complete in time,
+        in which case the chart has to be loaded by URL.
+        """
+        try:
+            driver.set_script_timeout(_CHART_SWITCH_TIMEOUT)
+            return bool(driver.execute_async_script(
+                "const [symbol, resolution, done] = arguments;"
+                "const api = window.TradingViewApi;"
+                "if (!api || !document.querySelector('.chart-container')) return done(false);"
+                "const chart = api.activeChart();"
+                "chart.setResolution(resolution, () => chart.setSymbol(symbol, () =>"
+                "  done(chart.symbol().endsWith(symbol.split(':').pop()) && chart.resolution() === resolution)));",
+                tv_symbol, timeframe
+            ))
+        except Exception:
+            return False
+    
+    def _wait_for_chart_idle(self, driver, polls: int = 20, interval: float = 0.25):
+        """Wait until the chart's canvases stop changing, up to polls * interval seconds"""
+        previous = None
+        for _ in range(polls):
+            try:
+                current = driver.execute_script(
+                    "return Array.from(document.querySelectorAll('.chart-container canvas'),"
+                    " canvas => canvas.toDataURL().length).join();"
+                )
+            except Exception:
+                current = None
+            if current and current == previous:
+                return
+            previous = current
+            time.sleep(interval)
+    
     def add_trade_annotations(self, signal: TradingSignal, analysis: Dict) -> str:
         """Generate annotation text for the trade"""
         outcome_emoji = {
@@ -308,91 +519,129 @@ class TradingViewScreenshotAnalyzer:
             return {}
         
         print(f"📊 Loading signals from {csv_file}")
-        df = pd.read_csv(csv_file)
+        # Read only the signal columns (matched case-insensitively), parsing timestamps on load
+        header = pd.read_csv(csv_file, nrows=0).columns
+        usecols = [col for col in header if col.lower() in _SIGNAL_COLUMNS]
+        df = pd.read_csv(
+            csv_file,
+            usecols=usecols,
+            dtype={col: str for col in usecols if col.lower() == 'symbol'},
+            parse_dates=[col for col in usecols if col.lower() == 'timestamp']
+        )
+        
+        # Canonical lower-case column names, with 'price' as an entry price alias
+        df.columns = df.columns.str.lower()
+        if 'entry_price' not in df.columns:
+            df = df.rename(columns={'price': 'entry_price'})
         
         # Convert timestamp column
-        if 'timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-        elif 'Timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['Timestamp'])
-        else:
+        if 'timestamp' not in df.columns:
             print("❌ No timestamp column found in CSV")
             return {}
+        df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
+        
+        symbols = df['symbol'] if 'symbol' in df.columns else pd.Series('', index=df.index)
+        symbols = symbols.fillna('').astype(str).str.strip().str.upper()
+        df['coin_name'] = symbols.str.removesuffix('USDT')
+        df['entry_price'] = pd.to_numeric(df['entry_price'], errors='coerce') if 'entry_price' in df.columns else 0.0
+        
+        # Drop invalid signals in one pass, then keep the first max_signals
+        valid = df['timestamp'].notna() & (df['coin_name'] != '') & (df['entry_price'] > 0)
+        if not valid.all():
+            print(f"⚠️ Skipping {(~valid).sum()} invalid signals")
+        df = df[valid].head(max_signals)
         
         # Setup WebDriver
         if not self.setup_webdriver():
             return {}
         
         results = {}
-        processed = 0
+        drivers = [self.driver]
         
         try:
-            for index, row in df.iterrows():
-                if processed >= max_signals:
+            # Create TradingSignal objects
+            signals = [
+                TradingSignal(timestamp=row.timestamp, coin_name=row.coin_name, entry_price=row.entry_price)
+                for row in df.itertuples(index=False)
+            ]
+            
+            # Fetch price data for all signals up front
+            self._prefetch_klines(signals)
+            
+            # Extra browsers so chart loads overlap across signals
+            for _ in range(min(_SCREENSHOT_WORKERS, len(signals)) - 1):
+                driver = self._create_webdriver()
+                if driver is None:
                     break
-                
+                drivers.append(driver)
+            
+            idle_drivers = queue.Queue()
+            for driver in drivers:
+                idle_drivers.put(driver)
+            
+            def process(numbered_signal):
+                number, signal = numbered_signal
+                driver = idle_drivers.get()
                 try:
-                    # Create TradingSignal object
-                    signal = TradingSignal(
-                        symbol=row.get('symbol', row.get('Symbol', '')),
-                        timestamp=row['timestamp'],
-                        entry_price=float(row.get('entry_price', row.get('Entry_Price', row.get('price', 0)))),
-                        signal_type=row.get('signal_type', row.get('Signal_Type', 'BUY')),
-                        confidence=row.get('confidence', row.get('Confidence', 0.8))
-                    )
-                    
-                    if not signal.symbol or signal.entry_price <= 0:
-                        print(f"⚠️ Skipping invalid signal: {signal.symbol}")
-                        continue
-                    
-                    print(f"\n🔍 Analyzing signal {processed + 1}/{min(len(df), max_signals)}: {signal.symbol}")
-                    
-                    # Analyze trade outcome
-                    analysis = self.analyze_trade_outcome(signal)
-                    
-                    # Generate filename
-                    timestamp_str = signal.timestamp.strftime("%Y%m%d_%H%M%S")
-                    filename = f"{signal.symbol}_{timestamp_str}_{analysis['outcome']}.png"
-                    
-                    # Capture screenshot
-                    success = self.capture_tradingview_screenshot(signal, analysis, filename)
-                    
-                    if success:
-                        # Generate annotation
-                        annotation = self.add_trade_annotations(signal, analysis)
-                        
-                        results[signal.symbol] = {
-                            'signal': signal,
-                            'analysis': analysis,
-                            'annotation': annotation,
-                            'screenshot_file': filename,
-                            'success': True
-                        }
-                        
-                        print(f"✅ Processed {signal.symbol}: {analysis['outcome']}")
-                        print(f"📊 Duration: {analysis['duration_minutes']:.0f}m, Timeframe: {analysis['recommended_timeframe']}")
-                    else:
-                        results[signal.symbol] = {
-                            'signal': signal,
-                            'analysis': analysis,
-                            'success': False,
-                            'error': 'Screenshot capture failed'
-                        }
-                    
-                    processed += 1
-                    time.sleep(2)  # Rate limiting
-                    
-                except Exception as e:
-                    print(f"❌ Error processing signal {index}: {e}")
-                    continue
+                    return self._process_signal(signal, driver, number, len(signals))
+                finally:
+                    idle_drivers.put(driver)
+            
+            with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+                for signal, result in zip(signals, executor.map(process, enumerate(signals, 1))):
+                    if result is not None:
+                        results[signal.symbol] = result
         
         finally:
-            if self.driver:
-                self.driver.quit()
-                print("🔒 WebDriver closed")
+            for driver in drivers:
+                driver.quit()
+            print("🔒 WebDriver closed")
         
         return results
     
+    def _process_signal(self, signal: TradingSignal, driver, number: int, total: int) -> Optional[Dict]:
+        """Analyze one signal and capture its screenshot with the given driver"""
+        try:
+            print(f"\n🔍 Analyzing signal {number}/{total}: {signal.symbol}")
+            
+            # Analyze trade outcome
+            analysis = self.analyze_trade_outcome(signal)
+            
+            # Generate filename
+            timestamp_str = signal.timestamp.strftime("%Y%m%d_%H%M%S")
+            filename = f"{signal.symbol}_{timestamp_str}_{analysis['outcome']}.png"
+            
+            # Capture screenshot
+            success = self.capture_tradingview_screenshot(signal, analysis, filename, driver)
+            
+            if success:
+                # Generate annotation
+                annotation = self.add_trade_annotations(signal, analysis)
+                
+                result = {
+                    'signal': signal,
+                    'analysis': analysis,
+                    'annotation': annotation,
+                    'screenshot_file': filename,
+                    'success': True
+                }
+                
+                print(f"✅ Processed {signal.symbol}: {analysis['outcome']}")
+                print(f"📊 Duration: {analysis['duration_minutes']:.0f}m, Timeframe: {analysis['recommended_timeframe']}")
+            else:
+                result = {
+                    'signal': signal,
+                    'analysis': analysis,
+                    'success': False,
+                    'error': 'Screenshot capture failed'
+                }
+            
+            return result
+            
+        except Exception as e:
+            print(f"❌ Error processing signal {signal.symbol}: {e}")
+            return None
+    
     def generate_summary_report(self, results: Dict) -> str:
         """Generate a summary report of all processed signals"""
         successful = sum(1 for r in results.values() if r.get('success', False))
@@ -410,7 +659,7 @@ class TradingViewScreenshotAnalyzer:
                 outcomes[outcome] = outcomes.get(outcome, 0) + 1
                 timeframes[timeframe] = timeframes.get(timeframe, 0) + 1
         
-        report = f"""
+        parts = [f"""
 📊 TRADINGVIEW SCREENSHOT ANALYSIS SUMMARY
 {'='*50}
 
@@ -420,18 +669,17 @@ class TradingViewScreenshotAnalyzer:
 📈 Success Rate: {(successful/total*100):.1f}%
 
 🎯 OUTCOMES:
-"""
-        for outcome, count in outcomes.items():
-            emoji = {'take_profit': '🎯', 'stop_loss': '🛑', 'ongoing': '⏳', 'no_data': '❓'}.get(outcome, '❓')
-            report += f"{emoji} {outcome.replace('_', ' ').title()}: {count}\n"
+"""]
+        emojis = {'take_profit': '🎯', 'stop_loss': '🛑', 'ongoing': '⏳', 'no_data': '❓'}
+        parts.extend(f"{emojis.get(outcome, '❓')} {outcome.replace('_', ' ').title()}: {count}\n"
+                     for outcome, count in outcomes.items())
         
-        report += "\n⏱️ TIMEFRAMES USED:\n"
-        for timeframe, count in timeframes.items():
-            report += f"📊 {timeframe}: {count}\n"
+        parts.append("\n⏱️ TIMEFRAMES USED:\n")
+        parts.extend(f"📊 {timeframe}: {count}\n" for timeframe, count in timeframes.items())
         
-        report += f"\n📁 Screenshots saved in: {self.screenshots_dir}/signals/\n"
+        parts.append(f"\n📁 Screenshots saved in: {self.screenshots_dir}/signals/\n")
         
-        return report
+        return "".join(parts)
     
     def create_enhanced_analyzer(self, signals_file: str = "signals_last12months.csv"):
         """Main method to run the enhanced screenshot analyzer"""
@@ -484,8 +732,13 @@ class TradingViewScreenshotAnalyzer:
                     'annotation': result['annotation']
                 }
         
-        with open(results_file, 'w') as f:
-            json.dump(json_results, f, indent=2)
+        if orjson is not None:
+            Path(results_file).write_bytes(
+                orjson.dumps(json_results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            )
+        else:
+            with open(results_file, 'w') as f:
+                json.dump(json_results, f, indent=2)
         
         print(f"💾 Detailed results saved to: {results_file}")
         print("🎉 Screenshot analysis complete!")
@@ -7,12 +7,17 @@ import sys
 from pathlib import Path
 import pandas as pd
 from datetime import datetime, timedelta
+from functools import lru_cache
+import gzip
+import hashlib
 import os
+import re
 import json
-from flask import Flask, render_template, request, jsonify
-import webbrowser
-import threading
-import time
+from flask import Flask, Response, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import FileSystemBytecodeCache
+from jinja2.ext import Extension
+from markupsafe import Markup, escape
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -23,55 +28,191 @@ try:
 except ImportError:
     pass
 
+# orjson backs the app's JSON provider (API responses and tojson) when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# waitress serves requests from a thread pool instead of Flask's development server when installed
+try:
+    import waitress
+except ImportError:
+    waitress = None
+
+# Worker threads handling dashboard and chart API requests
+_SERVER_THREADS = 8
+
+# Seconds browsers may reuse a cached page before revalidating it with its ETag
+_PAGE_MAX_AGE = 60
+
+# Portfolio table badge colour by close reason (anything else is shown as a warning)
+_RESULT_BADGES = {'PROFIT': 'success', 'LOSS': 'danger'}
+
+# Seconds browsers may cache static files, whose URLs carry a content hash
+_STATIC_MAX_AGE = 365 * 24 * 3600
+
+# Portfolio table rows rendered with the page and returned per /api/trades request
+_TRADES_PAGE_SIZE = 100
+
+# Signals CSV rows parsed at a time, bounding peak memory for long signal histories
+_SIGNALS_CHUNK_ROWS = 50_000
+
 from crypto_analyzer import TradingSignal
 import logging
 
 logger = logging.getLogger(__name__)
 
+class _OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify and the tojson template filter"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+class _StripIndentExtension(Extension):
+    """Drops template indentation and blank lines before compiling, so they never reach the rendered page"""
+    
+    def preprocess(self, source, name, filename=None):
+        return re.sub(r'^\s+', '', source, flags=re.MULTILINE)
+
+def _render_trade_rows(rows: pd.DataFrame) -> Markup:
+    """Portfolio table rows as escaped HTML, joined in Python rather than looped over in Jinja"""
+    return Markup(''.join(
+        f'<tr><td><strong>{escape(coin)}</strong></td><td>${escape(price)}</td>'
+        f'<td><span class="badge bg-{escape(badge_cls)}">{escape(reason)}</span></td>'
+        f'<td class="{escape(pnl_cls)}">${escape(pnl)}</td><td>{escape(hours)}h</td><td>${escape(risk)}</td></tr>'
+        for coin, price, reason, pnl, hours, risk, badge_cls, pnl_cls in rows.itertuples(index=False)
+    ))
+
+def _round_column(column: pd.Series, digits: int) -> pd.Series:
+    """Round values with Python's round(), like Jinja's round filter (numpy's rounding can differ in the last digit)"""
+    return column.map(lambda value: round(value, digits))
+
 class TradingViewTradeAnalyzer:
     """Web-based trade analyzer with TradingView widgets"""
     
     def __init__(self):
         self.app = Flask(__name__)
-        self.signals_data = []
-        self.trades_data = []
+        if orjson is not None:
+            self.app.json = _OrjsonProvider(self.app)
+        # Compiled templates are kept in the system temp directory, so restarts skip parsing them
+        self.app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+        self.app.jinja_env.add_extension(_StripIndentExtension)
+        self.app.config['SEND_FILE_MAX_AGE_DEFAULT'] = _STATIC_MAX_AGE
+        self.signals_data = ()
+        self.trades_df = pd.DataFrame(columns=['Coin', 'Limit_Price', 'Close_Reason', 'PnL', 'Hours_Held', 'Risk_Amount'])
         self.setup_routes()
     
     def setup_routes(self):
         """Setup Flask routes"""
         
-        @self.app.route('/')
-        def index():
-            """Main dashboard"""
+        @self.app.template_global()
+        @lru_cache(maxsize=None)
+        def static_version(filename):
+            """Content hash for a static file's URL, so a changed file is fetched despite caching"""
+            return hashlib.md5((Path(self.app.static_folder) / filename).read_bytes()).hexdigest()[:12]
+        
+        # Pages only depend on data loaded before the server starts, so each is rendered once
+        @lru_cache(maxsize=None)
+        def render_dashboard():
             return render_template('trade_dashboard.html', 
                                  signals=self.signals_data[:50],  # First 50 signals
                                  total_signals=len(self.signals_data))
         
+        @lru_cache(maxsize=None)
+        def render_trade_detail(trade_index):
+            return render_template('trade_detail.html', 
+                                 signal=self.signals_data[trade_index], 
+                                 trade_index=trade_index)
+        
+        @lru_cache(maxsize=None)
+        def trade_rows():
+            # Rounding and CSS classes come from the columns, so the table only interpolates values
+            trades = self.trades_df
+            pnl = trades['PnL']
+            return pd.DataFrame({
+                'Coin': trades['Coin'],
+                'Limit_Price': trades['Limit_Price'],
+                'Close_Reason': trades['Close_Reason'],
+                'PnL': _round_column(pnl, 2),
+                'Hours_Held': _round_column(trades['Hours_Held'], 1),
+                'Risk_Amount': _round_column(trades['Risk_Amount'], 2),
+                'badge_cls': trades['Close_Reason'].astype(object).map(_RESULT_BADGES).fillna('warning'),
+                'pnl_cls': pnl.gt(0).map({True: 'text-success', False: 'text-danger'})
+            })
+        
+        @lru_cache(maxsize=None)
+        def render_portfolio_summary():
+            # Aggregates come from the columns; only the first page of the table is rendered,
+            # later pages come from /api/trades and the chart series from /api/portfolio_charts
+            trades = self.trades_df
+            return render_template('portfolio_summary.html', 
+                                 table_body=_render_trade_rows(trade_rows().head(_TRADES_PAGE_SIZE)),
+                                 trade_count=len(trades),
+                                 page_size=_TRADES_PAGE_SIZE,
+                                 total_pnl=float(trades['PnL'].sum()),
+                                 avg_hours_held=float(trades['Hours_Held'].mean()))
+        
+        @lru_cache(maxsize=None)
+        def portfolio_charts_json():
+            trades = self.trades_df
+            close_reasons = trades['Close_Reason'].value_counts()
+            return self.app.json.dumps({
+                'result_counts': [int(close_reasons.get(reason, 0)) for reason in ('LOSS', 'PROFIT', 'NEITHER')],
+                'pnl_series': _round_column(trades['PnL'].cumsum(), 2).tolist()
+            }, separators=(',', ':'))
+        
+        @lru_cache(maxsize=None)
+        def encode_page(html):
+            body = html.encode()
+            return body, gzip.compress(body, compresslevel=6), hashlib.md5(body).hexdigest()
+        
+        def page_response(html, mimetype='text/html'):
+            """Serve a rendered page, gzipped when accepted, with cache headers and ETag revalidation"""
+            body, gzipped, etag = encode_page(html)
+            if 'gzip' in request.accept_encodings:
+                response = Response(gzipped, mimetype=mimetype)
+                response.headers['Content-Encoding'] = 'gzip'
+                etag += '-gzip'
+            else:
+                response = Response(body, mimetype=mimetype)
+            response.vary.add('Accept-Encoding')
+            response.set_etag(etag)
+            response.cache_control.public = True
+            response.cache_control.max_age = _PAGE_MAX_AGE
+            response.cache_control.must_revalidate = True
+            return response.make_conditional(request)
+        
+        @self.app.route('/')
+        def index():
+            """Main dashboard"""
+            return page_response(render_dashboard())
+        
         @self.app.route('/trade/<int:trade_index>')
         def trade_detail(trade_index):
             """Individual trade detail page"""
             if trade_index >= len(self.signals_data):
                 return "Trade not found", 404
             
-            signal = self.signals_data[trade_index]
-            return render_template('trade_detail.html', 
-                                 signal=signal, 
-                                 trade_index=trade_index)
+            return page_response(render_trade_detail(trade_index))
         
-        @self.app.route('/api/trade_data/<int:trade_index>')
-        def get_trade_data(trade_index):
-            """API endpoint for trade data"""
-            if trade_index >= len(self.signals_data):
-                return jsonify({"error": "Trade not found"}), 404
-            
+        @lru_cache(maxsize=None)
+        def signals_json():
+            return self.app.json.dumps(self.signals_data, separators=(',', ':'))
+        
+        @self.app.route('/api/signals')
+        def get_signals():
+            """All loaded signals, serialized once and cached by the browser"""
+            return page_response(signals_json(), mimetype='application/json')
+        
+        @lru_cache(maxsize=4096)
+        def trade_data_json(trade_index, stop_loss_pct, risk_reward_ratio):
             signal = self.signals_data[trade_index]
-            
-            # Get trading parameters from query
-            stop_loss_pct = float(request.args.get('stop_loss', 10))
-            risk_reward_ratio = float(request.args.get('risk_reward', 1.5))
-            
             trade_data = {
-                'symbol': signal['symbol'].replace('USDT', ''),  # TradingView format
+                'symbol': signal['symbol_tv'],  # TradingView format
                 'exchange': 'BINANCE',
                 'entry_price': signal['entry_price'],
                 'stop_loss_price': signal['entry_price'] * (1 - stop_loss_pct / 100),
@@ -81,765 +222,84 @@ class TradingViewTradeAnalyzer:
                 'risk_reward_ratio': risk_reward_ratio,
                 'coin_name': signal['coin_name']
             }
+            return self.app.json.dumps(trade_data, separators=(',', ':'))
+        
+        @self.app.route('/api/trade_data/<int:trade_index>')
+        def get_trade_data(trade_index):
+            """API endpoint for trade data"""
+            if trade_index >= len(self.signals_data):
+                return jsonify({"error": "Trade not found"}), 404
             
-            return jsonify(trade_data)
+            # Get trading parameters from query
+            stop_loss_pct = float(request.args.get('stop_loss', 10))
+            risk_reward_ratio = float(request.args.get('risk_reward', 1.5))
+            
+            return Response(trade_data_json(trade_index, stop_loss_pct, risk_reward_ratio),
+                            mimetype='application/json')
         
         @self.app.route('/portfolio_summary')
         def portfolio_summary():
             """Portfolio summary page"""
-            return render_template('portfolio_summary.html', 
-                                 trades=self.trades_data)
+            return page_response(render_portfolio_summary())
+        
+        @self.app.route('/api/portfolio_charts')
+        def get_portfolio_charts():
+            """Close reason counts and cumulative P&L for the portfolio charts"""
+            return page_response(portfolio_charts_json(), mimetype='application/json')
+        
+        @self.app.route('/api/trades')
+        def get_trades():
+            """A page of portfolio table rows"""
+            offset = max(request.args.get('offset', 0, type=int), 0)
+            limit = min(max(request.args.get('limit', _TRADES_PAGE_SIZE, type=int), 0), _TRADES_PAGE_SIZE)
+            rows = trade_rows().iloc[offset:offset + limit]
+            return jsonify({'rows': rows.to_dict('records'), 'total': len(self.trades_df)})
     
     def load_data(self):
         """Load signals and trades data"""
         try:
             # Load signals
             print("📊 Loading signals from CSV...")
-            df = pd.read_csv('signals_last12months.csv')
-            
-            for _, row in df.iterrows():
-                try:
-                    signal = TradingSignal.from_csv_row(row)
-                    self.signals_data.append({
-                        'coin_name': signal.coin_name,
-                        'symbol': signal.symbol,
-                        'entry_price': signal.entry_price,
-                        'timestamp': signal.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-                        'date': signal.timestamp.strftime('%Y-%m-%d'),
-                        'time': signal.timestamp.strftime('%H:%M:%S')
-                    })
-                except Exception as e:
-                    continue
+            signals_data = []
+            for chunk in pd.read_csv('signals_last12months.csv', chunksize=_SIGNALS_CHUNK_ROWS):
+                signals = TradingSignal.frame_from_dataframe(chunk)
+                coin_names = signals['coin_name']
+                symbols = coin_names.map({coin: TradingSignal.symbol_for(coin) for coin in coin_names.unique()})
+                symbols_tv = symbols.str.removesuffix('USDT')  # TradingView format
+                
+                # Coin names, symbols and dates repeat across signals, so one string object each is shared
+                signals_data.extend(
+                    {
+                        'coin_name': sys.intern(coin_name),
+                        'symbol': sys.intern(symbol),
+                        'symbol_tv': sys.intern(symbol_tv),
+                        'entry_price': entry_price,
+                        'timestamp': f"{date} {time_of_day}",
+                        'date': sys.intern(date),
+                        'time': time_of_day
+                    }
+                    for coin_name, symbol, symbol_tv, entry_price, date, time_of_day in zip(
+                        coin_names.tolist(), symbols.tolist(), symbols_tv.tolist(), signals['entry_price'].tolist(),
+                        signals['date'].tolist(), signals['time'].tolist()
+                    )
+                )
             
+            self.signals_data = tuple(signals_data)  # Read-only once the server starts
             print(f"✅ Loaded {len(self.signals_data)} signals")
             
             # Load trade results if available
-            csv_files = [f for f in os.listdir('.') if f.startswith('concurrent_portfolio_analysis_') and f.endswith('.csv')]
+            csv_files = list(Path('.').glob('concurrent_portfolio_analysis_*.csv'))
             if csv_files:
-                latest_csv = max(csv_files)
-                trades_df = pd.read_csv(latest_csv)
-                self.trades_data = trades_df.to_dict('records')
-                print(f"✅ Loaded {len(self.trades_data)} trade results from {latest_csv}")
+                latest_csv = max(csv_files, key=lambda path: path.stat().st_mtime)
+                self.trades_df = pd.read_csv(latest_csv, dtype={'Coin': 'category', 'Close_Reason': 'category'})
+                print(f"✅ Loaded {len(self.trades_df)} trade results from {latest_csv}")
             
         except Exception as e:
             print(f"❌ Error loading data: {e}")
     
-    def create_templates(self):
-        """Create HTML templates"""
-        # Create templates directory
-        os.makedirs('templates', exist_ok=True)
-        
-        # Main dashboard template
-        dashboard_html = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>TradingView Trade Analyzer</title>
-    <script type="text/javascript" src="https://s3.tradingview.com/tv.js"></script>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <style>
-        .trade-card { margin-bottom: 15px; cursor: pointer; transition: all 0.3s; }
-        .trade-card:hover { transform: translateY(-2px); box-shadow: 0 4px 8px rgba(0,0,0,0.1); }
-        .profit { color: #28a745; } .loss { color: #dc3545; } .neither { color: #ffc107; }
-        body { background-color: #f8f9fa; }
-        .navbar { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
-    </style>
-</head>
-<body>
-    <nav class="navbar navbar-dark">
-        <div class="container-fluid">
-            <span class="navbar-brand mb-0 h1">📊 TradingView Trade Analyzer</span>
-            <span class="navbar-text">{{total_signals}} Total Signals</span>
-        </div>
-    </nav>
-    
-    <div class="container-fluid mt-4">
-        <div class="row">
-            <div class="col-12">
-                <h3>📈 Signal Analysis Dashboard</h3>
-                <p class="text-muted">Click on any trade to view detailed TradingView chart with customizable timeframes</p>
-            </div>
-        </div>
-        
-        <div class="row">
-            {% for signal in signals %}
-            <div class="col-lg-3 col-md-4 col-sm-6">
-                <div class="card trade-card" onclick="openTrade({{loop.index0}})">
-                    <div class="card-body">
-                        <h5 class="card-title">{{signal.coin_name}}</h5>
-                        <p class="card-text">
-                            <strong>Entry:</strong> ${{signal.entry_price}}<br>
-                            <strong>Date:</strong> {{signal.date}}<br>
-                            <strong>Time:</strong> {{signal.time}}
-                        </p>
-                        <span class="badge bg-primary">{{signal.symbol}}</span>
-                    </div>
-                </div>
-            </div>
-            {% endfor %}
-        </div>
-    </div>
-    
-    <script>
-        function openTrade(index) {
-            window.open('/trade/' + index, '_blank');
-        }
-    </script>
-</body>
-</html>
-        '''
-        
-        # Trade detail template with enhanced TradingView widget
-        trade_detail_html = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Trade Analysis - {{signal.coin_name}}</title>
-    <script type="text/javascript" src="https://s3.tradingview.com/tv.js"></script>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <style>
-        body { background-color: #f8f9fa; }
-        .navbar { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
-        .control-panel { background: white; border-radius: 10px; padding: 20px; margin-bottom: 20px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-        .chart-container { background: white; border-radius: 10px; padding: 20px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-        .btn-timeframe { margin: 2px; }
-        .trade-info { background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); color: white; border-radius: 10px; padding: 15px; }
-        .alert-outcome { margin-top: 15px; }
-    </style>
-</head>
-<body>
-    <nav class="navbar navbar-dark">
-        <div class="container-fluid">
-            <a class="navbar-brand" href="/">📊 TradingView Trade Analyzer</a>
-            <span class="navbar-text">{{signal.coin_name}} Analysis</span>
-        </div>
-    </nav>
-    
-    <div class="container-fluid mt-4">
-        <!-- Control Panel -->
-        <div class="control-panel">
-            <div class="row">
-                <div class="col-md-8">
-                    <h5>⚙️ Trading Parameters</h5>
-                    <div class="row">
-                        <div class="col-md-3">
-                            <label class="form-label">Stop Loss %</label>
-                            <input type="number" class="form-control" id="stopLoss" value="10" step="0.5" min="1" max="50">
-                        </div>
-                        <div class="col-md-3">
-                            <label class="form-label">Risk:Reward</label>
-                            <input type="number" class="form-control" id="riskReward" value="1.5" step="0.1" min="0.5" max="10">
-                        </div>
-                        <div class="col-md-3">
-                            <label class="form-label">Days to Analyze</label>
-                            <input type="number" class="form-control" id="daysAhead" value="30" min="7" max="90">
-                        </div>
-                        <div class="col-md-3">
-                            <label class="form-label">&nbsp;</label>
-                            <button class="btn btn-success form-control" onclick="updateChart()">📊 Update Chart</button>
-                        </div>
-                    </div>
-                </div>
-                <div class="col-md-4">
-                    <h5>⏰ Chart Timeframe</h5>
-                    <div>
-                        <button class="btn btn-outline-primary btn-timeframe" onclick="changeTimeframe('5')">5m</button>
-                        <button class="btn btn-outline-primary btn-timeframe" onclick="changeTimeframe('15')">15m</button>
-                        <button class="btn btn-outline-primary btn-timeframe" onclick="changeTimeframe('60')">1h</button>
-                        <button class="btn btn-outline-primary btn-timeframe" onclick="changeTimeframe('240')">4h</button>
-                        <button class="btn btn-outline-primary btn-timeframe" onclick="changeTimeframe('1D')">1D</button>
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Trade Info -->
-        <div class="trade-info mb-3">
-            <div class="row">
-                <div class="col-md-2">
-                    <strong>💰 Entry Price:</strong><br>
-                    $<span id="entryPrice">{{signal.entry_price}}</span>
-                </div>
-                <div class="col-md-2">
-                    <strong>🛑 Stop Loss:</strong><br>
-                    $<span id="stopLossPrice">-</span> (<span id="stopLossPct">-</span>%)
-                </div>
-                <div class="col-md-2">
-                    <strong>🎯 Take Profit:</strong><br>
-                    $<span id="takeProfitPrice">-</span> (<span id="takeProfitPct">-</span>%)
-                </div>
-                <div class="col-md-3">
-                    <strong>📅 Signal Time:</strong><br>
-                    {{signal.timestamp}}
-                </div>
-                <div class="col-md-3">
-                    <strong>📊 Symbol:</strong><br>
-                    {{signal.symbol}} ({{signal.coin_name}})
-                </div>
-            </div>
-        </div>
-        
-        <!-- Trade Outcome Alert -->
-        <div id="tradeOutcome" class="alert-outcome"></div>
-        
-        <!-- TradingView Chart with Advanced Features -->
-        <div class="chart-container">
-            <div id="tradingview_chart" style="height: 700px;"></div>
-        </div>
-        
-        <!-- Chart Controls -->
-        <div class="mt-3">
-            <div class="card">
-                <div class="card-header">
-                    <h5>🎛️ Chart Controls & Analysis</h5>
-                </div>
-                <div class="card-body">
-                    <div class="row">
-                        <div class="col-md-6">
-                            <button class="btn btn-primary me-2" onclick="jumpToSignalTime()">📍 Jump to Signal Time</button>
-                            <button class="btn btn-warning me-2" onclick="toggleLevels()">📏 Toggle SL/TP Lines</button>
-                            <button class="btn btn-info me-2" onclick="showTradeOutcome()">🎯 Show Trade Outcome</button>
-                        </div>
-                        <div class="col-md-6">
-                            <div id="chartAnalysis">
-                                <p><strong>Chart Status:</strong> <span id="chartStatus">Loading...</span></p>
-                                <p><strong>Current Timeframe:</strong> <span id="currentTimeframe">1h</span></p>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        let widget;
-        let currentSymbol = '{{signal.symbol}}'.replace('USDT', '');
-        let currentTimeframe = '60';
-        let tradeIndex = {{trade_index}};
-        let signalTimestamp = new Date('{{signal.timestamp}}').getTime() / 1000; // Unix timestamp
-        let entryPrice = {{signal.entry_price}};
-        let showLevels = true;
-        
-        // Initialize enhanced TradingView widget
-        function initChart() {
-            const container = document.getElementById('tradingview_chart');
-            container.innerHTML = ''; // Clear previous widget
-            
-            // Calculate time range around signal
-            const daysAhead = parseInt(document.getElementById('daysAhead').value) || 30;
-            const signalDate = new Date('{{signal.timestamp}}');
-            const startDate = new Date(signalDate.getTime() - (7 * 24 * 60 * 60 * 1000)); // 7 days before
-            const endDate = new Date(signalDate.getTime() + (daysAhead * 24 * 60 * 60 * 1000)); // N days after
-            
-            widget = new TradingView.widget({
-                "width": "100%",
-                "height": 700,
-                "symbol": "BINANCE:" + currentSymbol + "USDT",
-                "interval": currentTimeframe,
-                "timezone": "Etc/UTC",
-                "theme": "light",
-                "style": "1",
-                "locale": "en",
-                "toolbar_bg": "#f1f3f6",
-                "enable_publishing": false,
-                "allow_symbol_change": false,
-                "container_id": "tradingview_chart",
-                "studies": [
-                    "Volume@tv-basicstudies",
-                    "RSI@tv-basicstudies"
-                ],
-                "show_popup_button": true,
-                "popup_width": "1200",
-                "popup_height": "800",
-                "range": "ytd", // Will be overridden
-                "hide_side_toolbar": false,
-                "details": true,
-                "hotlist": true,
-                "calendar": true,
-                // Advanced features for Premium
-                "studies_overrides": {
-                    "volume.volume.color.0": "#FF6B6B",
-                    "volume.volume.color.1": "#4ECDC4"
-                },
-                "overrides": {
-                    "mainSeriesProperties.candleStyle.upColor": "#4ECDC4",
-                    "mainSeriesProperties.candleStyle.downColor": "#FF6B6B",
-                    "mainSeriesProperties.candleStyle.borderUpColor": "#4ECDC4",
-                    "mainSeriesProperties.candleStyle.borderDownColor": "#FF6B6B"
-                },
-                "disabled_features": [],
-                "enabled_features": [
-                    "side_toolbar_in_fullscreen_mode",
-                    "header_in_fullscreen_mode",
-                    "timeframes_toolbar"
-                ]
-            });
-            
-            // When widget is ready, add custom elements
-            widget.onChartReady(function() {
-                console.log('Chart is ready');
-                document.getElementById('chartStatus').textContent = 'Ready';
-                
-                // Set up the chart with signal time and levels
-                setupTradeVisualization();
-            });
-        }
-        
-        // Setup trade visualization with signal markers and levels
-        function setupTradeVisualization() {
-            if (!widget || !widget.chart) return;
-            
-            try {
-                // Jump to signal time first
-                jumpToSignalTime();
-                
-                // Add trade levels and markers
-                setTimeout(() => {
-                    addTradeLevels();
-                    addSignalMarker();
-                    showTradeOutcome();
-                }, 1000);
-                
-            } catch (error) {
-                console.error('Error setting up trade visualization:', error);
-            }
-        }
-        
-        // Jump chart to signal timestamp
-        function jumpToSignalTime() {
-            if (!widget || !widget.chart) return;
-            
-            try {
-                const daysAhead = parseInt(document.getElementById('daysAhead').value) || 30;
-                const signalDate = new Date('{{signal.timestamp}}');
-                const startTime = Math.floor((signalDate.getTime() - (7 * 24 * 60 * 60 * 1000)) / 1000);
-                const endTime = Math.floor((signalDate.getTime() + (daysAhead * 24 * 60 * 60 * 1000)) / 1000);
-                
-                // Set visible range
-                widget.chart().setVisibleRange({
-                    from: startTime,
-                    to: endTime
-                });
-                
-                document.getElementById('chartStatus').textContent = 'Jumped to signal time';
-                
-            } catch (error) {
-                console.error('Error jumping to signal time:', error);
-                document.getElementById('chartStatus').textContent = 'Error jumping to time';
-            }
-        }
-        
-        // Add horizontal lines for SL and TP
-        function addTradeLevels() {
-            if (!widget || !widget.chart || !showLevels) return;
-            
-            try {
-                const stopLoss = parseFloat(document.getElementById('stopLoss').value);
-                const riskReward = parseFloat(document.getElementById('riskReward').value);
-                
-                const stopLossPrice = entryPrice * (1 - stopLoss / 100);
-                const takeProfitPrice = entryPrice * (1 + (stopLoss * riskReward) / 100);
-                
-                // Add horizontal lines using TradingView API
-                widget.chart().createShape({
-                    time: signalTimestamp,
-                    price: entryPrice
-                }, {
-                    shape: 'horizontal_line',
-                    text: `Entry: $${entryPrice.toFixed(4)}`,
-                    overrides: {
-                        linecolor: '#2196F3',
-                        linewidth: 2,
-                        linestyle: 0
-                    }
-                });
-                
-                widget.chart().createShape({
-                    time: signalTimestamp,
-                    price: stopLossPrice
-                }, {
-                    shape: 'horizontal_line',
-                    text: `Stop Loss: $${stopLossPrice.toFixed(4)} (-${stopLoss}%)`,
-                    overrides: {
-                        linecolor: '#F44336',
-                        linewidth: 2,
-                        linestyle: 2
-                    }
-                });
-                
-                widget.chart().createShape({
-                    time: signalTimestamp,
-                    price: takeProfitPrice
-                }, {
-                    shape: 'horizontal_line',
-                    text: `Take Profit: $${takeProfitPrice.toFixed(4)} (+${(stopLoss * riskReward).toFixed(1)}%)`,
-                    overrides: {
-                        linecolor: '#4CAF50',
-                        linewidth: 2,
-                        linestyle: 2
-                    }
-                });
-                
-                document.getElementById('chartStatus').textContent = 'Trade levels added';
-                
-            } catch (error) {
-                console.error('Error adding trade levels:', error);
-                document.getElementById('chartStatus').textContent = 'Error adding levels';
-            }
-        }
-        
-        // Add signal marker at entry point
-        function addSignalMarker() {
-            if (!widget || !widget.chart) return;
-            
-            try {
-                widget.chart().createShape({
-                    time: signalTimestamp,
-                    price: entryPrice
-                }, {
-                    shape: 'arrow_up',
-                    text: `BUY SIGNAL\\n${new Date('{{signal.timestamp}}').toLocaleString()}\\n$${entryPrice.toFixed(4)}`,
-                    overrides: {
-                        color: '#4CAF50',
-                        textcolor: '#FFFFFF',
-                        fontsize: 12
-                    }
-                });
-                
-                document.getElementById('chartStatus').textContent = 'Signal marker added';
-                
-            } catch (error) {
-                console.error('Error adding signal marker:', error);
-            }
-        }
-        
-        // Toggle SL/TP levels visibility
-        function toggleLevels() {
-            showLevels = !showLevels;
-            
-            if (showLevels) {
-                addTradeLevels();
-                document.querySelector('[onclick="toggleLevels()"]').textContent = '📏 Hide SL/TP Lines';
-            } else {
-                // Remove all shapes (simplified approach - recreate chart)
-                initChart();
-                document.querySelector('[onclick="toggleLevels()"]').textContent = '📏 Show SL/TP Lines';
-            }
-        }
-        
-        // Show trade outcome analysis
-        function showTradeOutcome() {
-            const stopLoss = parseFloat(document.getElementById('stopLoss').value);
-            const riskReward = parseFloat(document.getElementById('riskReward').value);
-            
-            fetch(`/api/trade_data/${tradeIndex}?stop_loss=${stopLoss}&risk_reward=${riskReward}`)
-                .then(response => response.json())
-                .then(data => {
-                    // Simulate trade outcome analysis (you can enhance this with real data)
-                    const outcome = analyzeTradeOutcome(data);
-                    displayTradeOutcome(outcome);
-                })
-                .catch(error => {
-                    console.error('Error:', error);
-                    document.getElementById('tradeOutcome').innerHTML = 
-                        '<div class="alert alert-danger">Error loading trade outcome analysis</div>';
-                });
-        }
-        
-        // Analyze trade outcome (placeholder - enhance with real analysis)
-        function analyzeTradeOutcome(data) {
-            // This is a simplified analysis - you can enhance with real historical data
-            const random = Math.random();
-            
-            if (random > 0.7) {
-                return {
-                    outcome: 'PROFIT',
-                    hours: (Math.random() * 48 + 2).toFixed(1),
-                    percentage: (data.stop_loss_pct * data.risk_reward_ratio).toFixed(1)
-                };
-            } else if (random > 0.3) {
-                return {
-                    outcome: 'LOSS',
-                    hours: (Math.random() * 24 + 1).toFixed(1),
-                    percentage: data.stop_loss_pct.toFixed(1)
-                };
-            } else {
-                return {
-                    outcome: 'NEITHER',
-                    hours: (Math.random() * 168 + 24).toFixed(1),
-                    percentage: 0
-                };
-            }
-        }
-        
-        // Display trade outcome
-        function displayTradeOutcome(outcome) {
-            let alertClass, icon, message;
-            
-            switch(outcome.outcome) {
-                case 'PROFIT':
-                    alertClass = 'alert-success';
-                    icon = '🎉';
-                    message = `Take Profit hit after ${outcome.hours} hours (+${outcome.percentage}%)`;
-                    break;
-                case 'LOSS':
-                    alertClass = 'alert-danger';
-                    icon = '🛑';
-                    message = `Stop Loss hit after ${outcome.hours} hours (-${outcome.percentage}%)`;
-                    break;
-                default:
-                    alertClass = 'alert-warning';
-                    icon = '⏳';
-                    message = `Neither SL nor TP hit within ${outcome.hours} hours`;
-            }
-            
-            document.getElementById('tradeOutcome').innerHTML = 
-                `<div class="alert ${alertClass}">
-                    <strong>${icon} Trade Outcome:</strong> ${message}
-                 </div>`;
-        }
-        
-        // Change timeframe
-        function changeTimeframe(timeframe) {
-            currentTimeframe = timeframe;
-            document.getElementById('currentTimeframe').textContent = 
-                timeframe === '5' ? '5m' : 
-                timeframe === '15' ? '15m' : 
-                timeframe === '60' ? '1h' : 
-                timeframe === '240' ? '4h' : '1D';
-            
-            // Update active button
-            document.querySelectorAll('.btn-timeframe').forEach(btn => btn.classList.remove('active'));
-            event.target.classList.add('active');
-            
-            // Recreate widget with new timeframe
-            initChart();
-        }
-        
-        // Update chart with new parameters
-        function updateChart() {
-            updateLevels();
-            initChart();
-        }
-        
-        // Update trade levels display
-        function updateLevels() {
-            const stopLoss = parseFloat(document.getElementById('stopLoss').value);
-            const riskReward = parseFloat(document.getElementById('riskReward').value);
-            
-            const stopLossPrice = entryPrice * (1 - stopLoss / 100);
-            const takeProfitPrice = entryPrice * (1 + (stopLoss * riskReward) / 100);
-            const takeProfitPct = stopLoss * riskReward;
-            
-            // Update display
-            document.getElementById('stopLossPrice').textContent = stopLossPrice.toFixed(4);
-            document.getElementById('stopLossPct').textContent = stopLoss.toFixed(1);
-            document.getElementById('takeProfitPrice').textContent = takeProfitPrice.toFixed(4);
-            document.getElementById('takeProfitPct').textContent = takeProfitPct.toFixed(1);
-        }
-        
-        // Initialize on page load
-        document.addEventListener('DOMContentLoaded', function() {
-            updateLevels();
-            initChart();
-            
-            // Set initial active timeframe
-            document.querySelector('[onclick="changeTimeframe(\\'60\\')"]').classList.add('active');
-        });
-    </script>
-</body>
-</html>
-        '''
-        
-        # Portfolio summary template
-        portfolio_html = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Portfolio Summary</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>
-        body { background-color: #f8f9fa; }
-        .navbar { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
-        .metric-card { background: white; border-radius: 10px; padding: 20px; margin-bottom: 20px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-    </style>
-</head>
-<body>
-    <nav class="navbar navbar-dark">
-        <div class="container-fluid">
-            <a class="navbar-brand" href="/">📊 TradingView Trade Analyzer</a>
-            <span class="navbar-text">Portfolio Summary</span>
-        </div>
-    </nav>
-    
-    <div class="container-fluid mt-4">
-        <div class="row">
-            <div class="col-md-12">
-                <h3>📊 Portfolio Performance Summary</h3>
-            </div>
-        </div>
-        
-        <div class="row">
-            <div class="col-md-3">
-                <div class="metric-card text-center">
-                    <h5>Total Trades</h5>
-                    <h2 class="text-primary">{{trades|length}}</h2>
-                </div>
-            </div>
-            <div class="col-md-3">
-                <div class="metric-card text-center">
-                    <h5>Win Rate</h5>
-                    <h2 class="text-success">0%</h2>
-                    <small class="text-muted">Currently all losses</small>
-                </div>
-            </div>
-            <div class="col-md-3">
-                <div class="metric-card text-center">
-                    <h5>Total P&L</h5>
-                    <h2 class="text-danger">$-{{trades|sum(attribute='PnL')|abs|round(2)}}</h2>
-                </div>
-            </div>
-            <div class="col-md-3">
-                <div class="metric-card text-center">
-                    <h5>Avg Hold Time</h5>
-                    <h2 class="text-info">{{(trades|sum(attribute='Hours_Held')/trades|length)|round(1)}}h</h2>
-                </div>
-            </div>
-        </div>
-        
-        <div class="row">
-            <div class="col-md-6">
-                <div class="metric-card">
-                    <h5>Trade Results Distribution</h5>
-                    <canvas id="resultsChart"></canvas>
-                </div>
-            </div>
-            <div class="col-md-6">
-                <div class="metric-card">
-                    <h5>P&L Over Time</h5>
-                    <canvas id="pnlChart"></canvas>
-                </div>
-            </div>
-        </div>
-        
-        <div class="row">
-            <div class="col-md-12">
-                <div class="metric-card">
-                    <h5>Detailed Trade Results</h5>
-                    <div class="table-responsive">
-                        <table class="table table-striped">
-                            <thead>
-                                <tr>
-                                    <th>Coin</th>
-                                    <th>Entry Price</th>
-                                    <th>Result</th>
-                                    <th>P&L</th>
-                                    <th>Hours Held</th>
-                                    <th>Risk Amount</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-                                {% for trade in trades %}
-                                <tr>
-                                    <td><strong>{{trade.Coin}}</strong></td>
-                                    <td>${{trade.Limit_Price}}</td>
-                                    <td>
-                                        <span class="badge bg-{% if trade.Close_Reason == 'PROFIT' %}success{% elif trade.Close_Reason == 'LOSS' %}danger{% else %}warning{% endif %}">
-                                            {{trade.Close_Reason}}
-                                        </span>
-                                    </td>
-                                    <td class="{% if trade.PnL > 0 %}text-success{% else %}text-danger{% endif %}">
-                                        ${{trade.PnL|round(2)}}
-                                    </td>
-                                    <td>{{trade.Hours_Held|round(1)}}h</td>
-                                    <td>${{trade.Risk_Amount|round(2)}}</td>
-                                </tr>
-                                {% endfor %}
-                            </tbody>
-                        </table>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        // Results distribution chart
-        const resultsCtx = document.getElementById('resultsChart').getContext('2d');
-        new Chart(resultsCtx, {
-            type: 'doughnut',
-            data: {
-                labels: ['Losses', 'Profits', 'Neither'],
-                datasets: [{
-                    data: [{{trades|selectattr('Close_Reason', 'equalto', 'LOSS')|list|length}}, 
-                           {{trades|selectattr('Close_Reason', 'equalto', 'PROFIT')|list|length}}, 
-                           {{trades|selectattr('Close_Reason', 'equalto', 'NEITHER')|list|length}}],
-                    backgroundColor: ['#dc3545', '#28a745', '#ffc107']
-                }]
-            },
-            options: {
-                responsive: true,
-                plugins: {
-                    legend: { position: 'bottom' }
-                }
-            }
-        });
-        
-        // P&L over time chart
-        const pnlCtx = document.getElementById('pnlChart').getContext('2d');
-        const trades = {{trades|tojson}};
-        let cumulativePnL = 0;
-        const pnlData = trades.map((trade, index) => {
-            cumulativePnL += trade.PnL;
-            return {x: index + 1, y: cumulativePnL};
-        });
-        
-        new Chart(pnlCtx, {
-            type: 'line',
-            data: {
-                datasets: [{
-                    label: 'Cumulative P&L',
-                    data: pnlData,
-                    borderColor: '#dc3545',
-                    backgroundColor: 'rgba(220, 53, 69, 0.1)',
-                    fill: true
-                }]
-            },
-            options: {
-                responsive: true,
-                scales: {
-                    x: { title: { display: true, text: 'Trade Number' } },
-                    y: { title: { display: true, text: 'Cumulative P&L ($)' } }
-                }
-            }
-        });
-    </script>
-</body>
-</html>
-        '''
-        
-        # Save templates
-        with open('templates/trade_dashboard.html', 'w') as f:
-            f.write(dashboard_html)
-        with open('templates/trade_detail.html', 'w') as f:
-            f.write(trade_detail_html)
-        with open('templates/portfolio_summary.html', 'w') as f:
-            f.write(portfolio_html)
-        
-        print("✅ Created HTML templates")
-    
     def run(self, host='127.0.0.1', port=5000, debug=False):
         """Run the web application"""
         self.load_data()
-        self.create_templates()
         
         print(f"\n🚀 Starting TradingView Trade Analyzer...")
         print(f"📊 Dashboard: http://{host}:{port}")
@@ -848,15 +308,17 @@ class TradingViewTradeAnalyzer:
         print(f"⏰ Use timeframe buttons (5m, 15m, 1h, 4h, 1D) to change chart period")
         print(f"⚙️ Adjust Stop Loss % and Risk:Reward ratio to see live calculations")
         
-        # Auto-open browser
-        def open_browser():
-            time.sleep(1.5)
-            webbrowser.open(f'http://{host}:{port}')
-        
-        threading.Timer(1, open_browser).start()
+        # Auto-open browser once the server is up (only once when the debug reloader restarts the app)
+        if os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
+            import threading
+            import webbrowser
+            threading.Timer(1, webbrowser.open_new_tab, args=(f'http://{host}:{port}',)).start()
         
         # Run Flask app
-        self.app.run(host=host, port=port, debug=debug)
+        if waitress is not None and not debug:
+            waitress.serve(self.app, host=host, port=port, threads=_SERVER_THREADS)
+        else:
+            self.app.run(host=host, port=port, debug=debug, threaded=True)
 
 def main():
     """Main function"""